@@ -13,6 +13,7 @@ import sys
 import json
 import re
 import time
+from functools import lru_cache
 from typing import Dict, List, Set, Optional
 from dotenv import load_dotenv
 from export_boards import MondayAPIClient
@@ -25,6 +26,7 @@ HF4U_LINK_COLUMN_ID = None  # Will be set from mapping
 CANDIDATE_ID_COLUMN_ID = None  # Will be set from mapping
 
 
+@lru_cache(maxsize=None)
 def normalize_person_name(name: str) -> str:
     """
     Normalize a person's name for fallback duplicate matching.
@@ -10,11 +10,14 @@ import os
 import sys
 import json
 import csv
+import re
 import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from dotenv import load_dotenv
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Load environment variables
 load_dotenv()
@@ -30,12 +33,26 @@ TARGET_BOARD_ID = "3567618324"
 class MondayAPIClient:
     """Client for interacting with Monday.com GraphQL API."""
     
-    def __init__(self, api_token: str):
+    def __init__(self, api_token: str, session: Optional[requests.Session] = None):
         self.api_token = api_token
         self.headers = {
             "Authorization": api_token,
             "Content-Type": "application/json"
         }
+        # One session for all calls: keep-alive instead of a new TLS connection per request
+        self.session = session or self._create_session()
+    
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Session with a keep-alive connection pool that retries failed connections."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=3)
+        )
+        session.mount("https://", adapter)
+        return session
     
     def execute_query(self, query: str, variables: Optional[Dict] = None) -> Dict:
         """Execute a GraphQL query/mutation."""
@@ -43,7 +60,7 @@ class MondayAPIClient:
         if variables:
             payload["variables"] = variables
         
-        response = requests.post(
+        response = self.session.post(
             MONDAY_API_URL,
             json=payload,
             headers=self.headers
@@ -59,11 +76,33 @@ class MondayAPIClient:
         response.raise_for_status()
         data = response.json()
         
+        # Handle an exhausted complexity budget (reported in the response body)
+        retry_in = self._complexity_retry_seconds(data)
+        if retry_in is not None:
+            print(f"Complexity budget exhausted. Waiting {retry_in} seconds...")
+            time.sleep(retry_in)
+            return self.execute_query(query, variables)
+        
         if "errors" in data:
             raise Exception(f"GraphQL errors: {data['errors']}")
         
         return data.get("data", {})
     
+    @staticmethod
+    def _complexity_retry_seconds(data: Dict) -> Optional[int]:
+        """Seconds until the complexity budget resets, if the response says it is exhausted."""
+        for error in data.get("errors") or []:
+            extensions = error.get("extensions") or {}
+            if extensions.get("code") == "COMPLEXITY_BUDGET_EXHAUSTED":
+                return int(extensions.get("retry_in_seconds", 60))
+        
+        # Older API versions: {"error_code": "ComplexityException", "error_message": "... reset in 23 seconds"}
+        if data.get("error_code") == "ComplexityException":
+            match = re.search(r"reset in (\d+) seconds", data.get("error_message", ""))
+            return int(match.group(1)) if match else 60
+        
+        return None
+    
     def get_board_info(self, board_id: str) -> Dict:
         """Fetch board name, columns, and groups."""
         query = """
@@ -89,13 +128,19 @@ class MondayAPIClient:
         boards = result.get("boards", [])
         return boards[0] if boards else {}
     
-    def get_all_items_paginated(self, board_id: str, cursor: Optional[str] = None, limit: int = 500, include_updates: bool = True) -> Dict:
-        """Fetch items from board with pagination."""
+    def get_all_items_paginated(self, board_id: str, cursor: Optional[str] = None, limit: int = 500, include_updates: bool = True,
+                                query_params: Optional[Dict] = None) -> Dict:
+        """
+        Fetch items from board with pagination.
+        
+        query_params (an ItemsQuery, e.g. {"rules": [...]}) filters items server-side.
+        It applies to the first page; the returned cursor carries it to later pages.
+        """
         if include_updates:
             query = """
-            query GetItems($boardId: [ID!]!, $cursor: String, $limit: Int!) {
+            query GetItems($boardId: [ID!]!, $cursor: String, $limit: Int!, $queryParams: ItemsQuery) {
                 boards(ids: $boardId) {
-                    items_page(limit: $limit, cursor: $cursor) {
+                    items_page(limit: $limit, cursor: $cursor, query_params: $queryParams) {
                         cursor
                         items {
                             id
@@ -120,9 +165,9 @@ class MondayAPIClient:
             """
         else:
             query = """
-            query GetItems($boardId: [ID!]!, $cursor: String, $limit: Int!) {
+            query GetItems($boardId: [ID!]!, $cursor: String, $limit: Int!, $queryParams: ItemsQuery) {
                 boards(ids: $boardId) {
-                    items_page(limit: $limit, cursor: $cursor) {
+                    items_page(limit: $limit, cursor: $cursor, query_params: $queryParams) {
                         cursor
                         items {
                             id
@@ -144,6 +189,8 @@ class MondayAPIClient:
         }
         if cursor:
             variables["cursor"] = cursor
+        elif query_params:
+            variables["queryParams"] = query_params
         
         result = self.execute_query(query, variables)
         boards = result.get("boards", [])
@@ -155,6 +202,18 @@ class MondayAPIClient:
             "cursor": items_page.get("cursor"),
             "items": items_page.get("items", [])
         }
+    
+    def iter_all_items(self, board_id: str, limit: int = 500, include_updates: bool = True,
+                       query_params: Optional[Dict] = None) -> Iterator[Dict]:
+        """Yield all items of a board, one page in memory at a time."""
+        cursor = None
+        while True:
+            result = self.get_all_items_paginated(board_id, cursor=cursor, limit=limit,
+                                                  include_updates=include_updates, query_params=query_params)
+            yield from result["items"]
+            cursor = result["cursor"]
+            if not cursor or not result["items"]:
+                break
 
 
 def export_board_structure(client: MondayAPIClient, board_id: str, board_name: str, output_dir: str):
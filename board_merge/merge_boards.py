@@ -15,14 +15,25 @@ import yaml
 import time
 import re
 import math
+import functools
+import shutil
 import tempfile
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from typing import AbstractSet, Dict, FrozenSet, List, Optional, Any, Tuple
 from dotenv import load_dotenv
 from export_boards import MondayAPIClient
 from build_duplicate_index import find_duplicate, extract_email_from_column_value, extract_hf4u_number
 
+try:
+    import orjson
+except ImportError:  # optional speedup, falls back to the stdlib json module
+    orjson = None
+
 SOURCE_BOARD_ID = "9661290405"
 TARGET_BOARD_ID = "3567618324"
 MAVM_BOARD_ID = "7076404604"  # Board 2. MA/VM
@@ -38,6 +49,58 @@ BOARD_MAPPING_FILES = {
 # Batch size for mutations (Monday.com limit is 50)
 BATCH_SIZE = 50
 
+# Parallel file copies (download + upload) in flight
+FILE_COPY_WORKERS = 8
+
+# Source items processed concurrently per page
+ITEM_WORKERS = 4
+
+# IDs per batched items/assets lookup query
+QUERY_BATCH_SIZE = 100
+
+# API call budget shared by all worker threads (calls per second, burst size)
+API_CALLS_PER_SECOND = 10.0
+API_BURST = 20
+
+# Target column type written by each item-level transformation
+TRANSFORM_TARGET_TYPES = {
+    "calculate_salary": "numbers",       # Gehalt
+    "parse_number": "numbers",           # Kinder
+    "gender_to_salutation": "dropdown",  # Anrede
+    "map_hours": "dropdown",
+    "map_languages": "dropdown",
+    "map_familienstand": "dropdown",
+    "map_nearest_city": "dropdown",
+    "map_nationalitaet": "dropdown",
+    "map_country": "dropdown",           # Geburtsland
+}
+
+# Default source columns for transforms that read more than their mapped column
+DEFAULT_YEARLY_SALARY_COLUMN_ID = "text_mktvfr1y"
+DEFAULT_MONTHLY_SALARY_COLUMN_ID = "text_mktvsm8z"
+DEFAULT_GENDER_COLUMN_ID = "dropdown_mktvnt0e"
+
+# Board schema column types -> type names used by prepare_value_for_create
+SCHEMA_TYPE_ALIASES = {
+    "long_text": "long-text",
+    "board_relation": "board-relation",
+    "color": "status",
+    "numeric": "numbers",
+}
+
+# Column types resolved from the schema; anything else falls back to value inspection
+KNOWN_COLUMN_TYPES = frozenset([
+    "name", "text", "long-text", "numbers", "link", "email", "phone", "date", "location",
+    "board-relation", "dropdown", "status", "file", "mirror", "formula",
+    "creation_log", "auto_number", "button", "subtasks", "dependency", "doc",
+])
+
+# Column types that create_item cannot copy (files are uploaded separately)
+SKIP_TYPES = frozenset([
+    "file", "mirror", "formula", "creation_log", "auto_number",
+    "button", "subtasks", "dependency", "doc",
+])
+
 # City coordinates for nearest city calculation (lat, lng)
 CITY_COORDINATES = {
     "Aachen": (50.7753, 6.0839),
@@ -181,6 +244,138 @@ CITY_COORDINATES = {
     "Würzburg": (49.7913, 9.9534),
 }
 
+# Valid countries for Geburtsland dropdown (same as in create_columns.py)
+# Kept as a tuple so it can be part of a cache key
+VALID_COUNTRIES = (
+    "Afghanistan", "Albanien", "Algerien", "Angola", "Argentinien",
+    "Armenien", "Aserbaidschan", "Belgien", "Benin", "Bosnien und Herzegowina",
+    "Brasilien", "Bulgarien", "China", "Deutschland", "Dominikanische Republik",
+    "Ecuador", "Eritrea", "Estland", "Frankreich", "Georgien", "Ghana",
+    "Griechenland", "Großbritannien", "Indien", "Irak", "Iran", "Irland",
+    "Israel", "Italien", "Japan", "Jemen", "Jordanien", "Kamerun", "Kapverden",
+    "Kasachstan", "Kolumbien", "Kongo", "Kosovo", "Kroatien", "Kuba",
+    "Lettland", "Litauen", "Mazedonien", "Marokko", "Mexiko", "Mongolei",
+    "Neuseeland", "Nicaragua", "Niederlande", "Nigeria", "Norwegen",
+    "Pakistan", "Polen", "Portugal", "Rumänien", "Russland", "Schweden",
+    "Schweiz", "Senegal", "Serbien", "Slowakei", "Slowenien", "Somalia",
+    "Spanien", "Sudan", "Syrien", "Südafrika", "Taiwan", "Thailand", "Togo",
+    "Tschechien", "Tunesien", "Türkei", "USA", "Ukraine", "Ungarn",
+    "Usbekistan", "Weißrussland", "Zypern", "Ägypten", "Äthiopien", "Österreich"
+)
+
+# Lowercased country name -> dropdown label (precomputed for case-insensitive matching)
+_COUNTRY_BY_LOWER = {country.lower(): country for country in VALID_COUNTRIES}
+
+# Gender texts (stripped, lowercase) that map directly to a salutation
+FEMALE_TEXTS = frozenset(["weiblich", "w", "female", "f"])
+MALE_TEXTS = frozenset(["männlich", "m", "male"])
+
+# Salary patterns: number with K/k suffix, dotted thousands, plain digit runs
+_SALARY_K_RE = re.compile(r'(\d+(?:[.,]\d+)?)\s*[Kk](?![a-zA-Z])')
+_SALARY_DOT_RE = re.compile(r'(\d{1,3}(?:\.\d{3})+)')
+_DIGITS_RE = re.compile(r'\d+')
+_SALARY_STRIP_RE = re.compile(r'[,\s]')
+
+# Number extraction for parse_text_to_number; the translate table deletes
+# every ASCII character except digits and "."
+_NUMBER_RE = re.compile(r'[\d.]+')
+_KEEP_DIGIT_TBL = str.maketrans("", "", "".join(
+    c for c in map(chr, range(128)) if not (c.isdigit() or c == ".")
+))
+
+# Separator for multi-select dropdown text ("Deutsch, Englisch")
+_COMMA_SPLIT_RE = re.compile(r'\s*,\s*')
+
+
+# JSON coding for column values and mutation payloads (orjson when installed)
+if orjson is not None:
+    _loads = orjson.loads
+    
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    _loads = json.loads
+    _dumps = json.dumps
+
+
+_UNPARSED = object()
+
+
+class ColumnValue:
+    """
+    A column value of an item with its text normalized and its JSON decoded once.
+    
+    Uses __slots__ (no per-instance __dict__) since the merger keeps one of
+    these for every column of every item it holds in memory.
+    """
+    __slots__ = ("id", "type", "text", "text_lc", "value", "_parsed")
+    
+    def __init__(self, id: Optional[str], text: Optional[str] = "", value: Any = None,
+                 type: Optional[str] = None):
+        self.id = id
+        self.type = type
+        self.text = (text or "").strip()
+        self.text_lc = self.text.lower()
+        self.value = value
+        self._parsed = _UNPARSED
+    
+    @classmethod
+    def from_api(cls, col_val: Dict) -> "ColumnValue":
+        """Wrap a column value dict as returned by the GraphQL API."""
+        return cls(col_val.get("id"), col_val.get("text"), col_val.get("value"), col_val.get("type"))
+    
+    @property
+    def parsed(self) -> Any:
+        """JSON-decoded value, parsed on first access. None if empty or not valid JSON."""
+        if self._parsed is _UNPARSED:
+            value = self.value
+            try:
+                self._parsed = _loads(value) if isinstance(value, str) else value
+            except ValueError:
+                self._parsed = None
+        return self._parsed
+
+
+def _index_item(item: Dict, column_ids: Optional[AbstractSet[str]] = None) -> Dict[str, ColumnValue]:
+    """
+    Get the column values of an item indexed by column ID.
+    
+    The index is built once per item and cached on the item itself
+    (item["_cv_index"]), so repeated column lookups are dict probes
+    instead of linear scans over item["column_values"].
+    
+    If column_ids is given, only those columns are wrapped and indexed; the
+    covered IDs are cached with the index (item["_cv_index_ids"], None = all).
+    A call that needs columns outside a restricted index rebuilds it in full.
+    """
+    index = item.get("_cv_index")
+    covered = item.get("_cv_index_ids")
+    if index is None or (covered is not None and (
+            column_ids is None or not (column_ids is covered or column_ids <= covered))):
+        index = {}
+        for col_val in item.get("column_values", []):
+            col_id = col_val.get("id")
+            if column_ids is None or col_id in column_ids:
+                index[col_id] = ColumnValue.from_api(col_val)
+        item["_cv_index"] = index
+        item["_cv_index_ids"] = column_ids
+    return index
+
+
+def _column_value(item: Dict, column_id: str) -> Optional[ColumnValue]:
+    """
+    Get one column value of an item (None if the item has no such column).
+    
+    Uses the cached index, even a restricted one, as long as it covers
+    column_id; otherwise the full index is built.
+    """
+    index = item.get("_cv_index")
+    if index is not None:
+        covered = item.get("_cv_index_ids")
+        if covered is None or column_id in covered:
+            return index.get(column_id)
+    return _index_item(item).get(column_id)
+
 
 class ColumnConverter:
     """Handles column value transformations."""
@@ -191,50 +386,56 @@ class ColumnConverter:
         if not text:
             return None
         
+        # Salary strings repeat across many items, so parse each distinct text once
+        return ColumnConverter._parse_salary_text_cached(text)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _parse_salary_text_cached(text: str) -> Optional[float]:
+        """Cached worker for parse_salary_text_to_number (text must be non-empty)."""
         # Remove currency symbols only (keep comma for decimal parsing in K pattern)
         cleaned = re.sub(r'[€$£]', '', text)
         
-        candidates = []
+        best = float("-inf")
+        consumed = []  # digit spans already used by a pattern, in cleaned_no_comma positions
         
         # Pattern 1: Numbers with K/k suffix (e.g., "100K", "100k", "85K", "75,5K")
         # This handles cases like "ca. 100K in VZ" -> 100000
-        # Match number (with optional decimal via . or ,) followed by K/k
-        k_pattern = r'(\d+(?:[.,]\d+)?)\s*[Kk](?![a-zA-Z])'
-        k_matches = re.findall(k_pattern, cleaned)
-        for match in k_matches:
-            # Replace comma with dot for decimal parsing
-            number_str = match.replace(',', '.')
-            # Multiply by 1000 for K suffix
-            candidates.append(float(number_str) * 1000)
+        k_spans = []
+        for match in _SALARY_K_RE.finditer(cleaned):
+            # Replace comma with dot for decimal parsing, multiply by 1000 for K suffix
+            best = max(best, float(match.group(1).replace(',', '.')) * 1000)
+            k_spans.append(match.span(1))
         
         # Now remove commas and extra spaces for other patterns
-        cleaned_no_comma = re.sub(r'[,\s]', '', cleaned)
+        cleaned_no_comma = _SALARY_STRIP_RE.sub('', cleaned)
         
-        # Pattern 2: Numbers with dots as thousand separators (e.g., "45.000")
-        dot_pattern = r'(\d{1,3}(?:\.\d{3})+)'
-        dot_matches = re.findall(dot_pattern, cleaned_no_comma)
-        for match in dot_matches:
-            # Remove dots and convert
-            number_str = match.replace('.', '')
-            candidates.append(float(number_str))
-        
-        # Pattern 3: Plain numbers (without dots or K suffix)
-        # Only add if not already covered by patterns above
-        numbers = re.findall(r'\d+', cleaned_no_comma)
-        for num_str in numbers:
-            # Skip if this number was part of a K-pattern match
-            is_k_number = any(num_str in match.replace(',', '.').replace('.', '') for match in k_matches)
-            # Skip if this number was part of a dot-pattern match
-            is_dot_number = any(num_str in match.replace('.', '') for match in dot_matches)
-            
-            if not is_k_number and not is_dot_number:
-                candidates.append(float(num_str))
+        if k_spans:
+            # Shift K spans by the number of characters stripped before them
+            removed_before = [0]
+            for char in cleaned:
+                removed_before.append(removed_before[-1] + (char == ',' or char.isspace()))
+            consumed = [(start - removed_before[start], end - removed_before[end]) for start, end in k_spans]
         
-        if candidates:
-            # Return the largest number (likely the salary)
-            return max(candidates)
+        # Pattern 2: Numbers with dots as thousand separators (e.g., "45.000")
+        for match in _SALARY_DOT_RE.finditer(cleaned_no_comma):
+            best = max(best, float(match.group(1).replace('.', '')))
+            consumed.append(match.span(1))
+        consumed.sort()
+        
+        # Pattern 3: Plain numbers, skipping digit runs inside a K or dot match.
+        # Both lists are ordered by position, so one pointer walks the consumed spans.
+        span_idx = 0
+        for match in _DIGITS_RE.finditer(cleaned_no_comma):
+            start, end = match.span()
+            while span_idx < len(consumed) and consumed[span_idx][1] <= start:
+                span_idx += 1
+            if any(s <= start and end <= e for s, e in consumed[span_idx:span_idx + 2]):
+                continue
+            best = max(best, float(match.group()))
         
-        return None
+        # Return the largest number (likely the salary)
+        return best if best > float("-inf") else None
     
     @staticmethod
     def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -300,18 +501,17 @@ class ColumnConverter:
         Returns:
             Tuple of (lat, lng) or None if not available
         """
-        for col_val in item.get("column_values", []):
-            if col_val.get("id") == location_col_id:
-                value = col_val.get("value")
-                if value:
-                    try:
-                        parsed = json.loads(value) if isinstance(value, str) else value
-                        lat = parsed.get("lat")
-                        lng = parsed.get("lng")
-                        if lat is not None and lng is not None:
-                            return (float(lat), float(lng))
-                    except:
-                        pass
+        col_val = _column_value(item, location_col_id)
+        if col_val:
+            if col_val.value:
+                try:
+                    parsed = col_val.parsed
+                    lat = parsed.get("lat")
+                    lng = parsed.get("lng")
+                    if lat is not None and lng is not None:
+                        return (float(lat), float(lng))
+                except (AttributeError, TypeError, ValueError):
+                    pass
         return None
     
     @staticmethod
@@ -338,14 +538,16 @@ class ColumnConverter:
         monthly_netto_value = None
         
         # Extract values from item
-        for col_val in item.get("column_values", []):
-            col_id = col_val.get("id")
-            text = (col_val.get("text") or "").strip()
-            
-            if col_id == yearly_brutto_col_id and text:
+        yearly_col_val = _column_value(item, yearly_brutto_col_id)
+        if yearly_col_val:
+            text = yearly_col_val.text
+            if text:
                 yearly_brutto_value = ColumnConverter.parse_salary_text_to_number(text)
-            
-            elif col_id == monthly_netto_col_id and text:
+        
+        monthly_col_val = _column_value(item, monthly_netto_col_id)
+        if monthly_col_val:
+            text = monthly_col_val.text
+            if text:
                 monthly_netto_value = ColumnConverter.parse_salary_text_to_number(text)
         
         # Priority 1: Use yearly brutto if available
@@ -368,33 +570,32 @@ class ColumnConverter:
         Returns option ID for target dropdown column.
         """
         # Extract gender value from item
-        for col_val in item.get("column_values", []):
-            if col_val.get("id") == gender_col_id:
-                text = (col_val.get("text") or "").strip().lower()
-                value = col_val.get("value", "")
-                
-                # Check text first
-                if "weiblich" in text:
-                    return 1  # Frau
-                elif "männlich" in text:
-                    return 2  # Herr
-                
-                # Check value (might be JSON with option ID)
-                if value:
-                    try:
-                        value_data = json.loads(value) if isinstance(value, str) else value
-                        if isinstance(value_data, dict):
-                            # Check if it has ids array
-                            ids = value_data.get("ids", [])
-                            if ids:
-                                option_id = ids[0] if isinstance(ids, list) else ids
-                                # Map: 1=weiblich→Frau, 2=männlich→Herr
-                                if option_id == 1:  # weiblich
-                                    return 1  # Frau
-                                elif option_id == 2:  # männlich
-                                    return 2  # Herr
-                    except:
-                        pass
+        col_val = _column_value(item, gender_col_id)
+        if col_val:
+            text = col_val.text_lc
+            
+            # Check text first - it matches for almost every real record
+            if text in FEMALE_TEXTS or "weiblich" in text:
+                return 1  # Frau
+            elif text in MALE_TEXTS or "männlich" in text:
+                return 2  # Herr
+            
+            # Check value (might be JSON with option ID)
+            if col_val.value:
+                try:
+                    value_data = col_val.parsed
+                    if isinstance(value_data, dict):
+                        # Check if it has ids array
+                        ids = value_data.get("ids", [])
+                        if ids:
+                            option_id = ids[0] if isinstance(ids, list) else ids
+                            # Map: 1=weiblich→Frau, 2=männlich→Herr
+                            if option_id == 1:  # weiblich
+                                return 1  # Frau
+                            elif option_id == 2:  # männlich
+                                return 2  # Herr
+                except (ValueError, TypeError, KeyError):
+                    pass
         
         return None
     
@@ -412,25 +613,20 @@ class ColumnConverter:
         Returns:
             List of mapped target values, or None if no mapping found
         """
-        for col_val in item.get("column_values", []):
-            if col_val.get("id") == source_col_id:
-                text = (col_val.get("text") or "").strip()
-                if not text:
-                    return None
-                
-                # Split by comma for multi-select dropdowns
-                source_values = [v.strip() for v in text.split(",") if v.strip()]
-                
-                # Map each value
-                mapped_values = []
-                for source_val in source_values:
-                    target_val = value_mapping.get(source_val)
-                    if target_val:
-                        mapped_values.append(target_val)
-                
-                return mapped_values if mapped_values else None
+        col_val = _column_value(item, source_col_id)
+        if not col_val:
+            return None
         
-        return None
+        text = col_val.text
+        if not text:
+            return None
+        
+        # Split by comma for multi-select dropdowns (text is already stripped,
+        # the regex swallows the whitespace around each comma) and map each value
+        mapped_values = [value_mapping[source_val] for source_val in _COMMA_SPLIT_RE.split(text)
+                         if value_mapping.get(source_val)]
+        
+        return mapped_values if mapped_values else None
     
     @staticmethod
     def parse_text_to_number(item: Dict, source_col_id: str) -> Optional[float]:
@@ -441,24 +637,27 @@ class ColumnConverter:
         Returns:
             Float value or None if not parseable
         """
-        for col_val in item.get("column_values", []):
-            if col_val.get("id") == source_col_id:
-                text = (col_val.get("text") or "").strip().lower()
-                if not text or text in ["keine", "nein", "-", "n/a", "bitte wählen"]:
-                    return None
-                
-                # Try to extract number
-                try:
-                    # Replace comma with dot for decimal
-                    text = text.replace(",", ".")
-                    # Extract first number found
-                    number_match = re.search(r'[\d.]+', text)
-                    if number_match:
-                        return float(number_match.group())
-                except (ValueError, AttributeError):
-                    pass
-                
-                return None
+        col_val = _column_value(item, source_col_id)
+        if not col_val:
+            return None
+        
+        text = col_val.text_lc
+        if not text or text in ["keine", "nein", "-", "n/a", "bitte wählen"]:
+            return None
+        
+        # Try to extract number
+        try:
+            # Replace comma with dot for decimal
+            text = text.replace(",", ".")
+            # Fast path: plain ASCII digits/dots ("2", "2.5") need no regex
+            if text.isascii() and len(text.translate(_KEEP_DIGIT_TBL)) == len(text):
+                return float(text)
+            # Extract first number found
+            number_match = _NUMBER_RE.search(text)
+            if number_match:
+                return float(number_match.group())
+        except (ValueError, AttributeError):
+            pass
         
         return None
     
@@ -472,147 +671,404 @@ class ColumnConverter:
         Args:
             item: Source item data
             source_col_id: Source column ID
-            value_mapping: Dict for special normalizations
+            value_mapping: Dict for special normalizations (keys must be lowercase)
             valid_countries: List of valid country names in target dropdown
             
         Returns:
             Country name matching target dropdown label, or None
         """
-        for col_val in item.get("column_values", []):
-            if col_val.get("id") == source_col_id:
-                text = (col_val.get("text") or "").strip()
-                if not text or text.lower() in ["bitte wählen", "-", "n/a", ""]:
-                    return None
-                
-                # Check explicit mapping first (case-insensitive)
-                text_lower = text.lower()
-                for source_val, target_val in value_mapping.items():
-                    if source_val.lower() == text_lower:
-                        return target_val
-                
-                # Try to find direct match in valid countries (case-insensitive)
-                for country in valid_countries:
-                    if country.lower() == text_lower:
-                        return country
-                
-                # Try partial match (for typos etc.)
-                for country in valid_countries:
-                    if text_lower in country.lower() or country.lower() in text_lower:
-                        return country
-                
-                return None
-        
-        return None
-    
-    @staticmethod
-    def convert_value(value: Any, transform_name: str, item: Optional[Dict] = None, 
-                     mapping: Optional[Dict] = None, transformations: Optional[Dict] = None) -> Any:
-        """Apply transformation to value."""
-        if transform_name == "parse_salary":
-            text = value.get("text", "") if isinstance(value, dict) else str(value)
-            return ColumnConverter.parse_salary_text_to_number(text)
-        
-        elif transform_name == "calculate_salary":
-            # This transformation needs the full item and mapping
-            if item and mapping:
-                yearly_col = mapping.get("source_yearly_column_id", "text_mktvfr1y")
-                monthly_col = mapping.get("source_monthly_column_id", "text_mktvsm8z")
-                return ColumnConverter.calculate_salary_from_multiple_sources(
-                    item, yearly_col, monthly_col
-                )
+        col_val = _column_value(item, source_col_id)
+        if not col_val:
             return None
         
-        elif transform_name == "gender_to_salutation":
-            # This transformation needs the full item and mapping
-            if item and mapping:
-                gender_col = mapping.get("source_gender_column_id", "dropdown_mktvnt0e")
-                return ColumnConverter.gender_to_salutation(item, gender_col)
+        text_lower = col_val.text_lc
+        if not text_lower or text_lower in ["bitte wählen", "-", "n/a", ""]:
             return None
         
-        elif transform_name in ("map_hours", "map_languages", "map_familienstand", "map_nationalitaet"):
-            # These transformations use value_mapping from the transformations config
-            if item and mapping and transformations:
-                source_col_id = mapping.get("source_column_id")
-                transform_config = transformations.get(transform_name, {})
-                value_mapping = transform_config.get("value_mapping", {})
-                
-                if source_col_id and value_mapping:
-                    return ColumnConverter.map_dropdown_values(item, source_col_id, value_mapping)
-            return None
+        # Check explicit mapping first (case-insensitive)
+        target_val = value_mapping.get(text_lower)
+        if target_val:
+            return target_val
         
-        elif transform_name == "parse_number":
-            # Parse number from text field
-            if item and mapping:
-                source_col_id = mapping.get("source_column_id")
-                if source_col_id:
-                    return ColumnConverter.parse_text_to_number(item, source_col_id)
-            return None
+        return ColumnConverter._match_country(text_lower, tuple(valid_countries))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _match_country(text_lower: str, valid_countries: Tuple[str, ...]) -> Optional[str]:
+        """
+        Cached country lookup for map_country_text_to_label.
         
-        elif transform_name == "map_country":
-            # Map country text to dropdown label
-            if item and mapping and transformations:
-                source_col_id = mapping.get("source_column_id")
-                transform_config = transformations.get(transform_name, {})
-                value_mapping = transform_config.get("value_mapping", {})
-                
-                # Valid countries list (same as in create_columns.py)
-                valid_countries = [
-                    "Afghanistan", "Albanien", "Algerien", "Angola", "Argentinien",
-                    "Armenien", "Aserbaidschan", "Belgien", "Benin", "Bosnien und Herzegowina",
-                    "Brasilien", "Bulgarien", "China", "Deutschland", "Dominikanische Republik",
-                    "Ecuador", "Eritrea", "Estland", "Frankreich", "Georgien", "Ghana",
-                    "Griechenland", "Großbritannien", "Indien", "Irak", "Iran", "Irland",
-                    "Israel", "Italien", "Japan", "Jemen", "Jordanien", "Kamerun", "Kapverden",
-                    "Kasachstan", "Kolumbien", "Kongo", "Kosovo", "Kroatien", "Kuba",
-                    "Lettland", "Litauen", "Mazedonien", "Marokko", "Mexiko", "Mongolei",
-                    "Neuseeland", "Nicaragua", "Niederlande", "Nigeria", "Norwegen",
-                    "Pakistan", "Polen", "Portugal", "Rumänien", "Russland", "Schweden",
-                    "Schweiz", "Senegal", "Serbien", "Slowakei", "Slowenien", "Somalia",
-                    "Spanien", "Sudan", "Syrien", "Südafrika", "Taiwan", "Thailand", "Togo",
-                    "Tschechien", "Tunesien", "Türkei", "USA", "Ukraine", "Ungarn",
-                    "Usbekistan", "Weißrussland", "Zypern", "Ägypten", "Äthiopien", "Österreich"
-                ]
-                
-                if source_col_id:
-                    return ColumnConverter.map_country_text_to_label(
-                        item, source_col_id, value_mapping, valid_countries
-                    )
-            return None
+        Args:
+            text_lower: Lowercased source text
+            valid_countries: Valid country names as a tuple
+        """
+        if valid_countries is VALID_COUNTRIES:
+            country_by_lower = _COUNTRY_BY_LOWER
+        else:
+            country_by_lower = {country.lower(): country for country in valid_countries}
         
-        elif transform_name == "map_nearest_city":
-            # Map location coordinates to nearest city dropdown label
-            if item and mapping:
-                source_col_id = mapping.get("source_column_id")
-                if source_col_id:
-                    coords = ColumnConverter.extract_location_from_item(item, source_col_id)
-                    if coords:
-                        lat, lng = coords
-                        nearest_city = ColumnConverter.find_nearest_city(lat, lng)
-                        if nearest_city:
-                            return [nearest_city]  # Return as list for dropdown
-            return None
+        # Try to find direct match in valid countries (case-insensitive)
+        country = country_by_lower.get(text_lower)
+        if country:
+            return country
+        
+        # Try partial match (for typos etc.)
+        for country_lower, country in country_by_lower.items():
+            if text_lower in country_lower or country_lower in text_lower:
+                return country
         
+        return None
+    
+    @staticmethod
+    def convert_value(value: Any, transform_name: str, item: Optional[Dict] = None, 
+                     mapping: Optional[Dict] = None, transformations: Optional[Dict] = None) -> Any:
+        """Apply transformation to value."""
+        handler = ColumnConverter._HANDLERS.get(transform_name)
+        if handler is None:
+            return value
+        return handler(value, transform_name, item, mapping, transformations)
+    
+    # Transformation handlers, dispatched by name through _HANDLERS
+    
+    @staticmethod
+    def _h_parse_salary(value, transform_name, item, mapping, transformations):
+        text = value.text if isinstance(value, ColumnValue) else str(value)
+        return ColumnConverter.parse_salary_text_to_number(text)
+    
+    @staticmethod
+    def _h_calculate_salary(value, transform_name, item, mapping, transformations):
+        # This transformation needs the full item and mapping
+        if item and mapping:
+            yearly_col = mapping.get("source_yearly_column_id", DEFAULT_YEARLY_SALARY_COLUMN_ID)
+            monthly_col = mapping.get("source_monthly_column_id", DEFAULT_MONTHLY_SALARY_COLUMN_ID)
+            return ColumnConverter.calculate_salary_from_multiple_sources(
+                item, yearly_col, monthly_col
+            )
+        return None
+    
+    @staticmethod
+    def _h_gender_to_salutation(value, transform_name, item, mapping, transformations):
+        # This transformation needs the full item and mapping
+        if item and mapping:
+            gender_col = mapping.get("source_gender_column_id", DEFAULT_GENDER_COLUMN_ID)
+            return ColumnConverter.gender_to_salutation(item, gender_col)
+        return None
+    
+    @staticmethod
+    def _h_map_dropdown(value, transform_name, item, mapping, transformations):
+        # These transformations use value_mapping from the transformations config
+        if item and mapping and transformations:
+            source_col_id = mapping.get("source_column_id")
+            transform_config = transformations.get(transform_name, {})
+            value_mapping = transform_config.get("value_mapping", {})
+            
+            if source_col_id and value_mapping:
+                return ColumnConverter.map_dropdown_values(item, source_col_id, value_mapping)
+        return None
+    
+    @staticmethod
+    def _h_parse_number(value, transform_name, item, mapping, transformations):
+        # Parse number from text field
+        if item and mapping:
+            source_col_id = mapping.get("source_column_id")
+            if source_col_id:
+                return ColumnConverter.parse_text_to_number(item, source_col_id)
+        return None
+    
+    @staticmethod
+    def _h_map_country(value, transform_name, item, mapping, transformations):
+        # Map country text to dropdown label
+        if item and mapping and transformations:
+            source_col_id = mapping.get("source_column_id")
+            transform_config = transformations.get(transform_name, {})
+            value_mapping = transform_config.get("_value_mapping_lower")
+            if value_mapping is None:
+                value_mapping = {k.lower(): v for k, v in transform_config.get("value_mapping", {}).items()}
+            
+            if source_col_id:
+                return ColumnConverter.map_country_text_to_label(
+                    item, source_col_id, value_mapping, VALID_COUNTRIES
+                )
+        return None
+    
+    @staticmethod
+    def _h_map_nearest_city(value, transform_name, item, mapping, transformations):
+        # Map location coordinates to nearest city dropdown label
+        if item and mapping:
+            source_col_id = mapping.get("source_column_id")
+            if source_col_id:
+                coords = ColumnConverter.extract_location_from_item(item, source_col_id)
+                if coords:
+                    lat, lng = coords
+                    nearest_city = ColumnConverter.find_nearest_city(lat, lng)
+                    if nearest_city:
+                        return [nearest_city]  # Return as list for dropdown
+        return None
+
+
+# Transformation name -> handler, built once so convert_value is a single dict lookup
+ColumnConverter._HANDLERS = {
+    "parse_salary": ColumnConverter._h_parse_salary,
+    "calculate_salary": ColumnConverter._h_calculate_salary,
+    "gender_to_salutation": ColumnConverter._h_gender_to_salutation,
+    "map_hours": ColumnConverter._h_map_dropdown,
+    "map_languages": ColumnConverter._h_map_dropdown,
+    "map_familienstand": ColumnConverter._h_map_dropdown,
+    "map_nationalitaet": ColumnConverter._h_map_dropdown,
+    "parse_number": ColumnConverter._h_parse_number,
+    "map_country": ColumnConverter._h_map_country,
+    "map_nearest_city": ColumnConverter._h_map_nearest_city,
+}
+
+
+# GraphQL mutations issued per item
+CREATE_ITEM_MUTATION = """
+mutation CreateItem($boardId: ID!, $itemName: String!, $columnValues: JSON!, $groupId: String) {
+    create_item(
+        board_id: $boardId,
+        item_name: $itemName,
+        column_values: $columnValues,
+        group_id: $groupId,
+        create_labels_if_missing: true
+    ) {
+        id
+    }
+}
+"""
+
+CHANGE_COLUMN_VALUE_MUTATION = """
+mutation ChangeColumnValue($boardId: ID!, $itemId: ID!, $columnId: String!, $value: JSON!) {
+    change_column_value(
+        board_id: $boardId,
+        item_id: $itemId,
+        column_id: $columnId,
+        value: $value,
+        create_labels_if_missing: true
+    ) {
+        id
+    }
+}
+"""
+
+CHANGE_MULTIPLE_COLUMN_VALUES_MUTATION = """
+mutation ChangeMultipleColumnValues($boardId: ID!, $itemId: ID!, $columnValues: JSON!) {
+    change_multiple_column_values(
+        board_id: $boardId,
+        item_id: $itemId,
+        column_values: $columnValues,
+        create_labels_if_missing: true
+    ) {
+        id
+    }
+}
+"""
+
+
+# Column type -> formatter for create_item values. Each handler gets the decoded
+# JSON value (None if there is none) and the stripped display text.
+
+def _create_text(parsed: Any, text: str) -> Any:
+    return text if text else None
+
+
+def _create_date(parsed: Any, text: str) -> Any:
+    # Extract just the date string "YYYY-MM-DD"
+    if isinstance(parsed, dict) and parsed.get("date"):
+        return parsed["date"]
+    return text if text else None
+
+
+def _create_link(parsed: Any, text: str) -> Any:
+    if isinstance(parsed, dict):
+        return {
+            "url": parsed.get("url", ""),
+            "text": parsed.get("text", "")
+        }
+    return None
+
+
+def _create_status(parsed: Any, text: str) -> Any:
+    if isinstance(parsed, dict) and "index" in parsed:
+        return {"index": parsed["index"]}
+    return None
+
+
+def _create_dropdown(parsed: Any, text: str) -> Any:
+    if isinstance(parsed, dict) and "ids" in parsed:
+        return {"ids": parsed["ids"]}
+    # Fallback to label
+    if text:
+        return {"labels": [text]}
+    return None
+
+
+def _create_location(parsed: Any, text: str) -> Any:
+    if isinstance(parsed, dict):
+        return {
+            "lat": parsed.get("lat"),
+            "lng": parsed.get("lng"),
+            "address": parsed.get("address", "")
+        }
+    return None
+
+
+def _create_board_relation(parsed: Any, text: str) -> Any:
+    if isinstance(parsed, dict):
+        linked_ids = parsed.get("linkedPulseIds", [])
+        if linked_ids:
+            item_ids = [lid for lid in (p.get("linkedPulseId") for p in linked_ids) if lid]
+            if item_ids:
+                return {"item_ids": item_ids}
+    return None
+
+
+def _create_phone(parsed: Any, text: str) -> Any:
+    if isinstance(parsed, dict):
+        return {
+            "phone": parsed.get("phone", ""),
+            "countryShortName": parsed.get("countryShortName", "DE")
+        }
+    return None
+
+
+def _create_default(parsed: Any, text: str) -> Any:
+    # Return as-is if it's valid JSON (minus metadata like changed_at), otherwise as text
+    if isinstance(parsed, dict):
+        return {k: v for k, v in parsed.items() if k not in ["changed_at"]}
+    return text if text else None
+
+
+_CREATE_VALUE_HANDLERS = {
+    "text": _create_text,
+    "long-text": _create_text,
+    "name": _create_text,
+    "numeric": _create_text,
+    "numbers": _create_text,
+    "date": _create_date,
+    "link": _create_link,
+    "status": _create_status,
+    "dropdown": _create_dropdown,
+    "location": _create_location,
+    "board-relation": _create_board_relation,
+    "phone": _create_phone,
+}
+
+
+def _dropdown_payload(converted: Any) -> Dict:
+    """Dropdown value for a converted result: labels for lists/strings, ids for option IDs."""
+    if isinstance(converted, list):
+        return {"labels": converted}
+    elif isinstance(converted, int):
+        return {"ids": [str(converted)]}
+    else:
+        return {"labels": [str(converted)]}
+
+
+def _multi_column_value(value: Any) -> Any:
+    """
+    Convert a change_column_value value (JSON string) to its entry in a
+    change_multiple_column_values payload.
+    
+    JSON objects and strings are decoded; numbers stay strings ("45000.0"),
+    which is how numeric columns expect them, and plain text is kept as is.
+    """
+    if not isinstance(value, str):
+        return value
+    try:
+        decoded = _loads(value)
+    except ValueError:
         return value
+    if decoded is None or isinstance(decoded, (bool, int, float)):
+        return value
+    return decoded
+
+
+# Column type -> formatter for transformed values, as create_item objects ...
+_CREATE_CONVERTED_FORMATTERS = {
+    "numeric": str,
+    "numbers": str,
+    "dropdown": _dropdown_payload,
+    "text": str,
+}
+
+# ... and as JSON strings for change_column_value
+_UPDATE_CONVERTED_FORMATTERS = {
+    # Monday.com expects just the number as a string for numeric columns
+    "numeric": str,
+    "numbers": str,
+    "dropdown": lambda converted: _dumps(_dropdown_payload(converted)),
+    "text": lambda converted: _dumps({"text": str(converted)}),
+}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket for API rate limiting.
+
+    acquire() returns immediately while tokens are left and otherwise sleeps
+    just long enough for the bucket to refill, so calls only wait when the
+    merge is actually running faster than the allowed rate.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Take tokens from the bucket, sleeping until they are available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # Reserve the tokens now; a negative balance is paid off by sleeping
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
 
 
 class BoardMerger:
     """Handles merging of boards."""
     
-    def __init__(self, client: MondayAPIClient, mapping_configs: Dict[str, Dict], duplicate_index: Dict, duplicate_group_id: Optional[str] = None, new_group_id: Optional[str] = None):
+    def __init__(self, client: MondayAPIClient, mapping_configs: Dict[str, Dict], duplicate_index: Dict, duplicate_group_id: Optional[str] = None, new_group_id: Optional[str] = None, source_columns: Optional[List[Dict]] = None):
         """
         Args:
             mapping_configs: Dict mapping board_id -> mapping_config
                              e.g. {"3567618324": config1, "7076404604": config2}
+            source_columns: Source board columns (id, type) from get_board_info,
+                            used to resolve each mapping's column type up front
         """
         self.client = client
         self.mapping_configs = mapping_configs
         self.duplicate_index = duplicate_index
         self.duplicate_group_id = duplicate_group_id
         self.new_group_id = new_group_id
-        # Collect all transformations from all configs
-        self.transformations = {}
+        # Transformations per target board (boards may define the same transform differently)
+        self.transformations_by_board = {
+            board_id: config.get("transformations", {})
+            for board_id, config in mapping_configs.items()
+        }
+        # Pre-lowercase value_mapping keys once for case-insensitive lookups
+        for transformations in self.transformations_by_board.values():
+            for transform_config in transformations.values():
+                value_mapping = transform_config.get("value_mapping")
+                if value_mapping:
+                    transform_config["_value_mapping_lower"] = {k.lower(): v for k, v in value_mapping.items()}
+        # Source columns any mapping reads; items only index these columns
+        self.needed_source_ids = self.collect_source_column_ids(mapping_configs)
+        # Resolve source column types from the board schema once per run
+        source_column_types = {}
+        for column in source_columns or []:
+            col_type = column.get("type") or ""
+            source_column_types[column.get("id")] = SCHEMA_TYPE_ALIASES.get(col_type, col_type)
         for config in mapping_configs.values():
-            self.transformations.update(config.get("transformations", {}))
+            for mapping in config.get("mappings", []):
+                col_type = source_column_types.get(mapping.get("source_column_id"))
+                if col_type in KNOWN_COLUMN_TYPES:
+                    mapping["source_column_type"] = col_type
         self.stats = {
             "created": 0,
             "updated": 0,
@@ -622,13 +1078,84 @@ class BoardMerger:
             "moved_new": 0
         }
         self.log_entries = []
+        # Guards stats and the pending queues, which item worker threads share
+        self._lock = threading.Lock()
+        # Lookups resolved in batches per page (see prefetch_lookups) or memoized
+        self._board_id_cache = {}     # item_id -> board_id (None = item not found)
+        self._asset_public_urls = {}  # asset_id -> public_url
+        # Queued mutations, flushed as aliased batch mutations (see flush_pending_mutations)
+        self._pending_moves = []    # (item_id, group_id, stats key)
+        self._pending_updates = []  # (item_id, body)
+        # File copies run in a thread pool; results are collected in drain_file_copies
+        self._file_pool = ThreadPoolExecutor(max_workers=FILE_COPY_WORKERS)
+        self._pending_file_copies = []  # (item_id, [Future])
+        # merge_strategy -> whether to write a target column, given its current value
+        self._update_strategies = {
+            "overwrite": lambda target_col_value: True,
+            "only_if_empty": self.is_empty,
+            # TODO: Implement append logic
+            "append": lambda target_col_value: False,
+            "skip": lambda target_col_value: False,
+        }
+        # Rate limit for API calls (replaces fixed sleeps after every call)
+        self._limiter = TokenBucket(API_CALLS_PER_SECOND, API_BURST)
+        # Shared HTTP session for file downloads/uploads (keep-alive + connection pool)
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[502, 503, 504])
+        )
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
     
     def get_mapping_for_board(self, board_id: str) -> Dict:
         """Get mapping config for a specific board."""
         return self.mapping_configs.get(board_id, self.mapping_configs.get(TARGET_BOARD_ID, {}))
     
+    @staticmethod
+    def collect_source_column_ids(mapping_configs: Dict[str, Dict]) -> FrozenSet[str]:
+        """Collect every source column ID read by the mappings of all boards."""
+        column_ids = set()
+        for config in mapping_configs.values():
+            for mapping in config.get("mappings", []):
+                column_ids.add(mapping.get("source_column_id"))
+                transform = mapping.get("transform")
+                if transform == "calculate_salary":
+                    column_ids.add(mapping.get("source_yearly_column_id", DEFAULT_YEARLY_SALARY_COLUMN_ID))
+                    column_ids.add(mapping.get("source_monthly_column_id", DEFAULT_MONTHLY_SALARY_COLUMN_ID))
+                elif transform == "gender_to_salutation":
+                    column_ids.add(mapping.get("source_gender_column_id", DEFAULT_GENDER_COLUMN_ID))
+        column_ids.discard(None)
+        return frozenset(column_ids)
+    
+    def index_source_item(self, item: Dict) -> Dict[str, ColumnValue]:
+        """Index a source item once, keeping only the columns the mappings read."""
+        return _index_item(item, self.needed_source_ids)
+    
+    def find_duplicate_match(self, item: Dict, email_col_id: str, hf4u_col_id: str,
+                             candidate_id_col_id: Optional[str] = None) -> Optional[Dict]:
+        """
+        Look up an item in the duplicate index once and cache the result on the item.
+
+        Wet runs ask for the match twice per item (prefetch_lookups and
+        process_item); the second lookup is a dict probe.
+        """
+        if "_duplicate_match" not in item:
+            item["_duplicate_match"] = find_duplicate(
+                item, self.duplicate_index, email_col_id, hf4u_col_id, candidate_id_col_id
+            )
+        return item["_duplicate_match"]
+    
+    def get_transformations_for_board(self, board_id: str) -> Dict:
+        """Get transformations config for a specific board."""
+        return self.transformations_by_board.get(board_id, self.transformations_by_board.get(TARGET_BOARD_ID, {}))
+    
     def get_item_board_id(self, item_id: str) -> Optional[str]:
         """Get the board ID for an item."""
+        if item_id in self._board_id_cache:
+            return self._board_id_cache[item_id]
+        
         query = """
         query GetItemBoard($itemId: ID!) {
             items(ids: [$itemId]) {
@@ -639,10 +1166,12 @@ class BoardMerger:
         }
         """
         try:
-            result = self.client.execute_query(query, {"itemId": item_id})
+            result = self._execute(query, {"itemId": item_id})
             items = result.get("items", [])
-            if items:
-                return items[0].get("board", {}).get("id")
+            board_id = items[0].get("board", {}).get("id") if items else None
+            # Cache found and not-found results; errors are retried on the next call
+            self._board_id_cache[item_id] = board_id
+            return board_id
         except Exception as e:
             self.log_entries.append({
                 "action": "get_board_error",
@@ -651,6 +1180,120 @@ class BoardMerger:
             })
         return None
     
+    def get_item_board_ids(self, item_ids: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Get the board IDs for several items, QUERY_BATCH_SIZE items per query.
+        
+        Results are stored in the board ID cache used by get_item_board_id.
+        
+        Returns:
+            Dict item_id -> board_id (None if the item was not found)
+        """
+        query = """
+        query GetItemBoards($itemIds: [ID!]!, $limit: Int!) {
+            items(ids: $itemIds, limit: $limit) {
+                id
+                board {
+                    id
+                }
+            }
+        }
+        """
+        board_ids = {}
+        for start in range(0, len(item_ids), QUERY_BATCH_SIZE):
+            chunk = item_ids[start:start + QUERY_BATCH_SIZE]
+            try:
+                result = self._execute(query, {"itemIds": chunk, "limit": len(chunk)})
+            except Exception as e:
+                self.log_entries.append({
+                    "action": "get_board_error",
+                    "item_ids": chunk,
+                    "error": str(e)
+                })
+                continue
+            
+            found = {
+                str(item.get("id")): (item.get("board") or {}).get("id")
+                for item in result.get("items", [])
+            }
+            for item_id in chunk:
+                board_ids[item_id] = found.get(str(item_id))
+        
+        self._board_id_cache.update(board_ids)
+        return board_ids
+    
+    def get_asset_public_urls(self, asset_ids: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Get public download URLs for several assets, QUERY_BATCH_SIZE assets per query.
+        
+        Results are stored for copy_file_to_item.
+        
+        Returns:
+            Dict asset_id -> public_url
+        """
+        query = """
+        query GetAssets($assetIds: [ID!]!) {
+            assets(ids: $assetIds) {
+                id
+                public_url
+            }
+        }
+        """
+        public_urls = {}
+        for start in range(0, len(asset_ids), QUERY_BATCH_SIZE):
+            chunk = asset_ids[start:start + QUERY_BATCH_SIZE]
+            try:
+                result = self._execute(query, {"assetIds": chunk})
+            except Exception as e:
+                self.log_entries.append({
+                    "action": "get_asset_error",
+                    "asset_ids": chunk,
+                    "error": str(e)[:100]
+                })
+                continue
+            
+            for asset in result.get("assets", []):
+                if asset.get("public_url"):
+                    public_urls[str(asset.get("id"))] = asset["public_url"]
+        
+        self._asset_public_urls.update(public_urls)
+        return public_urls
+    
+    def prefetch_lookups(self, items: List[Dict], mappings: List[Dict],
+                         email_col_id: str, hf4u_col_id: str,
+                         candidate_id_col_id: Optional[str] = None):
+        """
+        Resolve everything process_item looks up per item for a whole page at once.
+        
+        - Board IDs of duplicate target items (get_item_board_ids)
+        - Public URLs of files that will be copied to new items (get_asset_public_urls)
+        """
+        file_source_col_ids = {mapping.get("source_column_id") for mapping in mappings}
+        target_item_ids = []
+        asset_ids = []
+        
+        for item in items:
+            duplicate_match = self.find_duplicate_match(
+                item, email_col_id, hf4u_col_id, candidate_id_col_id
+            )
+            if duplicate_match and duplicate_match.get("target_item_id"):
+                target_item_id = duplicate_match["target_item_id"]
+                if target_item_id not in self._board_id_cache:
+                    target_item_ids.append(target_item_id)
+                continue
+            
+            # New item: its file columns will be copied
+            for col_val in self.index_source_item(item).values():
+                if col_val.type == "file" and col_val.id in file_source_col_ids:
+                    asset_id, _, _ = self.extract_file_info(col_val)
+                    if asset_id and asset_id not in self._asset_public_urls:
+                        asset_ids.append(asset_id)
+        
+        if target_item_ids:
+            self.get_item_board_ids(list(dict.fromkeys(target_item_ids)))
+        if asset_ids:
+            self.get_asset_public_urls(list(dict.fromkeys(asset_ids)))
+    
     def copy_file_to_item(self, asset_id: str, target_item_id: str, 
                           target_column_id: str, filename: str) -> bool:
         """
@@ -673,8 +1316,8 @@ class BoardMerger:
             return False
         
         try:
-            # 1. Get public URL for the asset
-            public_url = self.get_asset_public_url(asset_id)
+            # 1. Get public URL for the asset (usually resolved by prefetch_lookups)
+            public_url = self._asset_public_urls.get(asset_id) or self.get_asset_public_url(asset_id)
             if not public_url:
                 self.log_entries.append({
                     "action": "file_no_public_url",
@@ -684,20 +1327,20 @@ class BoardMerger:
                 return False
             
             # 2. Download file from public URL (no auth needed)
-            download_response = requests.get(public_url, timeout=60)
-            
-            if download_response.status_code != 200:
-                self.log_entries.append({
-                    "action": "file_download_error",
-                    "asset_id": asset_id,
-                    "status_code": download_response.status_code
-                })
-                return False
-            
-            # 3. Save to temp file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f"_{filename}") as tmp:
-                tmp.write(download_response.content)
-                tmp_path = tmp.name
+            # 3. Stream it to a temp file (large files are never held in memory)
+            with self._http.get(public_url, timeout=60, stream=True) as download_response:
+                if download_response.status_code != 200:
+                    self.log_entries.append({
+                        "action": "file_download_error",
+                        "asset_id": asset_id,
+                        "status_code": download_response.status_code
+                    })
+                    return False
+                
+                download_response.raw.decode_content = True
+                with tempfile.NamedTemporaryFile(delete=False, suffix=f"_{filename}") as tmp:
+                    shutil.copyfileobj(download_response.raw, tmp, length=1 << 20)
+                    tmp_path = tmp.name
             
             try:
                 # 4. Upload to Monday.com via /v2/file endpoint
@@ -719,7 +1362,7 @@ class BoardMerger:
                         'variables[file]': (filename, f, 'application/octet-stream')
                     }
                     
-                    upload_response = requests.post(
+                    upload_response = self._http.post(
                         "https://api.monday.com/v2/file",
                         headers={"Authorization": self.client.api_token},
                         files=files,
@@ -751,7 +1394,7 @@ class BoardMerger:
                 # Clean up temp file
                 try:
                     os.unlink(tmp_path)
-                except:
+                except OSError:
                     pass
                     
         except Exception as e:
@@ -763,7 +1406,33 @@ class BoardMerger:
             })
             return False
     
-    def extract_file_info(self, col_value: Dict) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    def _copy_file_rate_limited(self, asset_id: str, target_item_id: str,
+                                target_column_id: str, filename: str) -> bool:
+        """Run copy_file_to_item after taking the file upload's rate-limit tokens."""
+        self._limiter.acquire(1.5)  # File uploads are heavier than plain mutations
+        return self.copy_file_to_item(asset_id, target_item_id, target_column_id, filename)
+    
+    def submit_file_copy(self, asset_id: str, target_item_id: str,
+                         target_column_id: str, filename: str) -> Future:
+        """Start copy_file_to_item in the file thread pool and return its Future."""
+        return self._file_pool.submit(
+            self._copy_file_rate_limited, asset_id, target_item_id, target_column_id, filename
+        )
+    
+    def drain_file_copies(self):
+        """Wait for all submitted file copies and log the upload results per item."""
+        with self._lock:
+            pending, self._pending_file_copies = self._pending_file_copies, []
+        for item_id, futures in pending:
+            files_uploaded = sum(1 for future in futures if future.result())
+            self.log_entries.append({
+                "action": "files_uploaded",
+                "item_id": item_id,
+                "uploaded": files_uploaded,
+                "total": len(futures)
+            })
+    
+    def extract_file_info(self, col_value: Optional[ColumnValue]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
         Extract file info from a file column value.
         
@@ -774,21 +1443,20 @@ class BoardMerger:
             return None, None, None
         
         # URL is in the 'text' field (protected URL, for reference)
-        protected_url = (col_value.get("text") or "").strip()
+        protected_url = col_value.text
         
         # Asset ID and filename from value JSON
-        value = col_value.get("value")
         asset_id = None
         filename = "file"
         
-        if value:
+        if col_value.value:
             try:
-                parsed = json.loads(value) if isinstance(value, str) else value
+                parsed = col_value.parsed
                 files = parsed.get("files", [])
                 if files and len(files) > 0:
                     asset_id = files[0].get("assetId")
                     filename = files[0].get("name", "file")
-            except:
+            except (AttributeError, TypeError, KeyError, IndexError):
                 pass
         
         if not asset_id:
@@ -806,7 +1474,7 @@ class BoardMerger:
         }
         """
         try:
-            result = self.client.execute_query(query, {"assetIds": [asset_id]})
+            result = self._execute(query, {"assetIds": [asset_id]})
             assets = result.get("assets", [])
             if assets and len(assets) > 0:
                 return assets[0].get("public_url")
@@ -837,7 +1505,7 @@ class BoardMerger:
         }
         
         try:
-            self.client.execute_query(mutation, variables)
+            self._execute(mutation, variables)
             return True
         except Exception as e:
             self.log_entries.append({
@@ -847,6 +1515,149 @@ class BoardMerger:
             })
             return False
     
+    def _execute_aliased_mutation(self, operation_name: str, field: str,
+                                  arg_types: Dict[str, str], rows: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Execute the same mutation field for several rows in a single request.
+        
+        Builds e.g.
+            mutation Op($item_id_0: ID!, ...) { m0: field(item_id: $item_id_0, ...) { id } m1: ... }
+        
+        Args:
+            operation_name: GraphQL operation name
+            field: Mutation field name (e.g. "move_item_to_group")
+            arg_types: Argument name -> GraphQL type (e.g. {"item_id": "ID!"})
+            rows: One dict of argument values per mutation
+            
+        Returns:
+            Success flag per row (raises if the request itself fails)
+        """
+        var_defs = []
+        fields = []
+        variables = {}
+        for i, row in enumerate(rows):
+            args = []
+            for arg, arg_type in arg_types.items():
+                var_name = f"{arg}_{i}"
+                var_defs.append(f"${var_name}: {arg_type}")
+                args.append(f"{arg}: ${var_name}")
+                variables[var_name] = row[arg]
+            fields.append(f"m{i}: {field}({', '.join(args)}) {{ id }}")
+        
+        mutation = f"mutation {operation_name}({', '.join(var_defs)}) {{ {' '.join(fields)} }}"
+        result = self._execute(mutation, variables)
+        return [bool((result.get(f"m{i}") or {}).get("id")) for i in range(len(rows))]
+    
+    def batch_move_items_to_group(self, moves: List[Tuple[str, str]]) -> List[bool]:
+        """
+        Move several items to groups, BATCH_SIZE moves per request.
+        
+        Args:
+            moves: List of (item_id, group_id)
+            
+        Returns:
+            Success flag per move
+        """
+        results = []
+        for start in range(0, len(moves), BATCH_SIZE):
+            chunk = moves[start:start + BATCH_SIZE]
+            try:
+                results.extend(self._execute_aliased_mutation(
+                    "MoveItemsToGroup", "move_item_to_group",
+                    {"item_id": "ID!", "group_id": "String!"},
+                    [{"item_id": item_id, "group_id": group_id} for item_id, group_id in chunk]
+                ))
+            except Exception as e:
+                # Retry one by one so a single bad item does not fail the whole batch
+                self.log_entries.append({
+                    "action": "batch_move_error",
+                    "count": len(chunk),
+                    "error": str(e)[:200]
+                })
+                for item_id, group_id in chunk:
+                    results.append(self.move_item_to_group(item_id, SOURCE_BOARD_ID, group_id))
+        return results
+    
+    def batch_create_updates(self, updates: List[Tuple[str, str]]) -> List[bool]:
+        """
+        Create several updates (comments), BATCH_SIZE updates per request.
+        
+        Args:
+            updates: List of (item_id, body)
+            
+        Returns:
+            Success flag per update
+        """
+        results = []
+        for start in range(0, len(updates), BATCH_SIZE):
+            chunk = updates[start:start + BATCH_SIZE]
+            try:
+                results.extend(self._execute_aliased_mutation(
+                    "CreateUpdates", "create_update",
+                    {"item_id": "ID!", "body": "String!"},
+                    [{"item_id": item_id, "body": body} for item_id, body in chunk]
+                ))
+            except Exception as e:
+                # Retry one by one so a single bad item does not fail the whole batch
+                self.log_entries.append({
+                    "action": "batch_create_update_error",
+                    "count": len(chunk),
+                    "error": str(e)[:200]
+                })
+                for item_id, body in chunk:
+                    results.append(self.create_update(item_id, body))
+        return results
+    
+    def _execute(self, query: str, variables: Optional[Dict] = None) -> Dict:
+        """Run a GraphQL query/mutation after taking a token from the rate limiter."""
+        self._limiter.acquire()
+        return self.client.execute_query(query, variables)
+    
+    def count(self, stats_key: str):
+        """Increment a stats counter (safe to call from item worker threads)."""
+        with self._lock:
+            self.stats[stats_key] += 1
+    
+    def queue_move_item_to_group(self, item_id: str, group_id: str, stats_key: str):
+        """Queue a group move; stats[stats_key] is incremented once the move succeeds."""
+        with self._lock:
+            self._pending_moves.append((item_id, group_id, stats_key))
+            full = len(self._pending_moves) >= BATCH_SIZE
+        if full:
+            self.flush_pending_moves()
+    
+    def queue_update(self, item_id: str, body: str):
+        """Queue an update (comment) for batched creation."""
+        with self._lock:
+            self._pending_updates.append((item_id, body))
+            full = len(self._pending_updates) >= BATCH_SIZE
+        if full:
+            self.flush_pending_updates()
+    
+    def flush_pending_moves(self):
+        """Execute all queued group moves."""
+        with self._lock:
+            pending, self._pending_moves = self._pending_moves, []
+        if not pending:
+            return
+        results = self.batch_move_items_to_group([(item_id, group_id) for item_id, group_id, _ in pending])
+        for (_, _, stats_key), success in zip(pending, results):
+            if success:
+                self.count(stats_key)
+    
+    def flush_pending_updates(self):
+        """Execute all queued updates."""
+        with self._lock:
+            pending, self._pending_updates = self._pending_updates, []
+        if pending:
+            self.batch_create_updates(pending)
+    
+    def flush_pending_mutations(self):
+        """Execute all queued moves and updates and wait for running file copies."""
+        self.flush_pending_moves()
+        self.flush_pending_updates()
+        self.drain_file_copies()
+    
     def link_source_to_duplicate(self, source_item_id: str, duplicate_item_id: str) -> bool:
         """
         Link source item to the found duplicate via board-relation column.
@@ -862,7 +1673,7 @@ class BoardMerger:
             True if successful, False otherwise
         """
         # Build the value for board-relation column (overwrite mode)
-        relation_value = json.dumps({"item_ids": [int(duplicate_item_id)]})
+        relation_value = _dumps({"item_ids": [int(duplicate_item_id)]})
         
         success = self.update_single_column(
             source_item_id,
@@ -902,14 +1713,15 @@ class BoardMerger:
             "body": body
         }
         try:
-            self.client.execute_query(mutation, variables)
-            time.sleep(0.1) # Small delay
+            self._execute(mutation, variables)
+            return True
         except Exception as e:
             self.log_entries.append({
                 "action": "create_update_error",
                 "item_id": item_id,
                 "error": str(e)
             })
+            return False
 
     def transfer_updates(self, source_item: Dict, target_item_id: str):
         """Transfer updates from source item to target item (combined into one)."""
@@ -928,16 +1740,13 @@ class BoardMerger:
             # Combine all updates with a separator, add header
             updates_body = "<br><br><hr><br><br>".join(combined_parts)
             full_body = f"<strong>Übertrag HR4You</strong><br><br>{updates_body}"
-            self.create_update(target_item_id, full_body)
+            self.queue_update(target_item_id, full_body)
     
-    def get_column_value(self, item: Dict, column_id: str) -> Optional[Dict]:
+    def get_column_value(self, item: Dict, column_id: str) -> Optional[ColumnValue]:
         """Get column value from item by column ID."""
-        for col_val in item.get("column_values", []):
-            if col_val.get("id") == column_id:
-                return col_val
-        return None
+        return _column_value(item, column_id)
     
-    def is_empty(self, col_value: Optional[Dict]) -> bool:
+    def is_empty(self, col_value: Optional[ColumnValue]) -> bool:
         """Check if column value is empty.
         
         Uses 'text' as primary indicator - if no text is displayed to the user,
@@ -947,7 +1756,7 @@ class BoardMerger:
         if not col_value:
             return True
         
-        text = (col_value.get("text") or "").strip()
+        text = col_value.text
         
         # If there's visible text, column is not empty
         if text:
@@ -956,7 +1765,7 @@ class BoardMerger:
         # No text = empty (even if value has stale/orphaned data)
         return True
     
-    def get_column_type_from_value(self, col_value: Dict) -> str:
+    def get_column_type_from_value(self, col_value: Optional[ColumnValue]) -> str:
         """
         Infer column type from the value structure.
         Returns the column type or 'unknown'.
@@ -964,47 +1773,44 @@ class BoardMerger:
         if not col_value:
             return "unknown"
         
-        value = col_value.get("value")
-        if not value:
+        if not col_value.value:
             return "text"
         
-        try:
-            parsed = json.loads(value) if isinstance(value, str) else value
-            if not isinstance(parsed, dict):
-                return "text"
-            
-            # Detect by structure
-            if "url" in parsed and "text" in parsed:
-                return "link"
-            if "email" in parsed:
-                return "email"
-            if "phone" in parsed:
-                return "phone"
-            if "date" in parsed:
-                return "date"
-            if "lat" in parsed and "lng" in parsed:
-                return "location"
-            if "linkedPulseIds" in parsed:
-                return "board-relation"
-            if "ids" in parsed:
-                return "dropdown"
-            if "index" in parsed:
-                return "status"
-            if "files" in parsed:
-                return "file"
-            
-            return "text"
-        except:
+        parsed = col_value.parsed
+        if not isinstance(parsed, dict):
             return "text"
+        
+        # Detect by structure
+        if "url" in parsed and "text" in parsed:
+            return "link"
+        if "email" in parsed:
+            return "email"
+        if "phone" in parsed:
+            return "phone"
+        if "date" in parsed:
+            return "date"
+        if "lat" in parsed and "lng" in parsed:
+            return "location"
+        if "linkedPulseIds" in parsed:
+            return "board-relation"
+        if "ids" in parsed:
+            return "dropdown"
+        if "index" in parsed:
+            return "status"
+        if "files" in parsed:
+            return "file"
+        
+        return "text"
     
-    def prepare_value_for_create(self, col_value: Dict, col_type: str, 
+    def prepare_value_for_create(self, col_value: ColumnValue, col_type: str, 
                                   transform: Optional[str] = None,
                                   item: Optional[Dict] = None,
-                                  mapping: Optional[Dict] = None) -> Any:
+                                  mapping: Optional[Dict] = None,
+                                  board_id: str = TARGET_BOARD_ID) -> Any:
         """
         Prepare a column value for create_item API.
         
-        Returns Python objects that will be JSON-serialized later by json.dumps(column_values).
+        Returns Python objects that will be JSON-serialized later by _dumps(column_values).
         
         Return types by column:
         - text: str
@@ -1021,185 +1827,58 @@ class BoardMerger:
         if transform:
             converted = ColumnConverter.convert_value(
                 col_value, transform, item=item, mapping=mapping,
-                transformations=self.transformations
+                transformations=self.get_transformations_for_board(board_id)
             )
-            if converted is not None:
-                if col_type in ("numeric", "numbers"):
-                    return str(converted)
-                elif col_type == "dropdown":
-                    if isinstance(converted, list):
-                        return {"labels": converted}
-                    elif isinstance(converted, int):
-                        return {"ids": [str(converted)]}
-                    else:
-                        return {"labels": [str(converted)]}
-                elif col_type == "text":
-                    return str(converted)
+            formatter = _CREATE_CONVERTED_FORMATTERS.get(col_type)
+            if converted is not None and formatter:
+                return formatter(converted)
             return None
         
         # No transformation - use original value
-        text = (col_value.get("text") or "").strip()
-        value = col_value.get("value")
+        text = col_value.text
+        value = col_value.value
         
         if not text and not value:
             return None
         
         # Format based on column type
-        if col_type in ("text", "long-text", "name"):
-            return text if text else None
-        
-        if col_type == "date":
-            # Extract just the date string
-            if value:
-                try:
-                    parsed = json.loads(value) if isinstance(value, str) else value
-                    date_val = parsed.get("date")
-                    if date_val:
-                        return date_val  # Just the date string "YYYY-MM-DD"
-                except:
-                    pass
-            return text if text else None
-        
-        if col_type == "link":
-            if value:
-                try:
-                    parsed = json.loads(value) if isinstance(value, str) else value
-                    return {
-                        "url": parsed.get("url", ""),
-                        "text": parsed.get("text", "")
-                    }
-                except:
-                    pass
-            return None
-        
-        if col_type == "status":
-            if value:
-                try:
-                    parsed = json.loads(value) if isinstance(value, str) else value
-                    if "index" in parsed:
-                        return {"index": parsed["index"]}
-                except:
-                    pass
-            return None
-        
-        if col_type == "dropdown":
-            if value:
-                try:
-                    parsed = json.loads(value) if isinstance(value, str) else value
-                    if "ids" in parsed:
-                        return {"ids": parsed["ids"]}
-                except:
-                    pass
-            # Fallback to label
-            if text:
-                return {"labels": [text]}
-            return None
-        
-        if col_type == "location":
-            if value:
-                try:
-                    parsed = json.loads(value) if isinstance(value, str) else value
-                    return {
-                        "lat": parsed.get("lat"),
-                        "lng": parsed.get("lng"),
-                        "address": parsed.get("address", "")
-                    }
-                except:
-                    pass
-            return None
-        
-        if col_type == "board-relation":
-            if value:
-                try:
-                    parsed = json.loads(value) if isinstance(value, str) else value
-                    linked_ids = parsed.get("linkedPulseIds", [])
-                    if linked_ids:
-                        item_ids = [p.get("linkedPulseId") for p in linked_ids if p.get("linkedPulseId")]
-                        if item_ids:
-                            return {"item_ids": item_ids}
-                except:
-                    pass
-            return None
-        
-        if col_type == "phone":
-            if value:
-                try:
-                    parsed = json.loads(value) if isinstance(value, str) else value
-                    return {
-                        "phone": parsed.get("phone", ""),
-                        "countryShortName": parsed.get("countryShortName", "DE")
-                    }
-                except:
-                    pass
+        handler = _CREATE_VALUE_HANDLERS.get(col_type, _create_default)
+        try:
+            return handler(col_value.parsed if value else None, text)
+        except (AttributeError, TypeError, ValueError, KeyError):
             return None
-        
-        if col_type in ("numeric", "numbers"):
-            return text if text else None
-        
-        # Default: return as-is if it's valid JSON, otherwise as text
-        if value:
-            try:
-                parsed = json.loads(value) if isinstance(value, str) else value
-                # Remove metadata like changed_at
-                if isinstance(parsed, dict):
-                    cleaned = {k: v for k, v in parsed.items() if k not in ["changed_at"]}
-                    return cleaned
-            except:
-                pass
-        
-        return text if text else None
     
-    def prepare_column_value(self, source_col_val: Dict, target_col_type: str, 
+    def prepare_column_value(self, source_col_val: ColumnValue, target_col_type: str, 
                             transform: Optional[str] = None, 
                             item: Optional[Dict] = None,
-                            mapping: Optional[Dict] = None) -> Any:
+                            mapping: Optional[Dict] = None,
+                            board_id: str = TARGET_BOARD_ID) -> Any:
         """Prepare column value for target board format."""
         if transform:
             converted = ColumnConverter.convert_value(
                 source_col_val, transform, item=item, mapping=mapping, 
-                transformations=self.transformations
+                transformations=self.get_transformations_for_board(board_id)
             )
-            if converted is not None:
-                # Format based on target column type
-                if target_col_type == "numeric" or target_col_type == "numbers":
-                    # Monday.com expects just the number as a string for numeric columns
-                    return str(converted)
-                elif target_col_type == "dropdown":
-                    # Dropdown columns need labels in format: {"labels": ["Label1", "Label2"]}
-                    # For multi-select dropdowns, converted is a list of labels
-                    if isinstance(converted, list):
-                        return json.dumps({"labels": converted})
-                    elif isinstance(converted, int):
-                        return json.dumps({"ids": [str(converted)]})
-                    else:
-                        return json.dumps({"labels": [str(converted)]})
-                elif target_col_type == "text":
-                    return json.dumps({"text": str(converted)})
+            # Format based on target column type
+            formatter = _UPDATE_CONVERTED_FORMATTERS.get(target_col_type)
+            if converted is not None and formatter:
+                return formatter(converted)
         
         # Use original value
-        value = source_col_val.get("value")
-        text = source_col_val.get("text", "")
+        value = source_col_val.value
+        text = source_col_val.text
         
         if value:
             return value
         elif text:
-            return json.dumps({"text": text})
+            return _dumps({"text": text})
         
         return None
     
-    def should_update_column(self, merge_strategy: str, target_col_value: Optional[Dict]) -> bool:
+    def should_update_column(self, merge_strategy: str, target_col_value: Optional[ColumnValue]) -> bool:
         """Determine if column should be updated based on merge strategy."""
-        if merge_strategy == "overwrite":
-            return True
-        elif merge_strategy == "only_if_empty":
-            return self.is_empty(target_col_value)
-        elif merge_strategy == "append":
-            # TODO: Implement append logic
-            return False
-        elif merge_strategy == "skip":
-            return False
-        
-        return False
+        check = self._update_strategies.get(merge_strategy)
+        return check(target_col_value) if check else False
     
     def create_item(self, item: Dict, mappings: List[Dict], group_id: Optional[str] = None) -> Optional[str]:
         """
@@ -1219,9 +1898,8 @@ class BoardMerger:
         file_columns = []   # For separate file upload
         email_columns = []  # For separate email update
         
-        # Skip these column types in initial creation
-        SKIP_TYPES = ["file", "mirror", "formula", "creation_log", "auto_number", 
-                      "button", "subtasks", "dependency", "doc"]
+        # Source column lookup, built once instead of per mapping
+        source_index = self.index_source_item(item)
         
         for mapping in mappings:
             source_col_id = mapping.get("source_column_id")
@@ -1232,10 +1910,12 @@ class BoardMerger:
                 continue
             
             # Get source column value
-            source_col_val = self.get_column_value(item, source_col_id)
+            source_col_val = source_index.get(source_col_id)
             
-            # Detect column type
-            col_type = self.get_column_type_from_value(source_col_val) if source_col_val else "text"
+            # Column type from the board schema; inspect the value only for unknown columns
+            col_type = mapping.get("source_column_type")
+            if not col_type:
+                col_type = self.get_column_type_from_value(source_col_val) if source_col_val else "text"
             
             # Handle file columns separately
             if col_type == "file":
@@ -1252,7 +1932,7 @@ class BoardMerger:
             # Handle email columns separately (API bug workaround)
             if col_type == "email":
                 if source_col_val:
-                    text = (source_col_val.get("text") or "").strip()
+                    text = source_col_val.text
                     if text:
                         email_columns.append({
                             "target_col_id": target_col_id,
@@ -1267,16 +1947,9 @@ class BoardMerger:
             # Handle transformations
             if transform:
                 # Transformations that need special handling
-                if transform == "calculate_salary":
-                    col_type = "numbers"
-                elif transform == "gender_to_salutation":
-                    col_type = "dropdown"
-                elif transform in ("map_hours", "map_languages", "map_country", "map_familienstand", "map_nearest_city", "map_nationalitaet"):
-                    col_type = "dropdown"
-                elif transform == "parse_number":
-                    col_type = "numbers"
+                col_type = TRANSFORM_TARGET_TYPES.get(transform, col_type)
                 
-                dummy_col_val = source_col_val or {"id": source_col_id, "text": "", "value": ""}
+                dummy_col_val = source_col_val or ColumnValue(source_col_id)
                 prepared = self.prepare_value_for_create(
                     dummy_col_val, col_type, transform, item=item, mapping=mapping
                 )
@@ -1294,32 +1967,17 @@ class BoardMerger:
             if prepared:
                 column_values[target_col_id] = prepared
         
-        # Create item mutation
-        mutation = """
-        mutation CreateItem($boardId: ID!, $itemName: String!, $columnValues: JSON!, $groupId: String) {
-            create_item(
-                board_id: $boardId,
-                item_name: $itemName,
-                column_values: $columnValues,
-                group_id: $groupId,
-                create_labels_if_missing: true
-            ) {
-                id
-            }
-        }
-        """
-        
         variables = {
             "boardId": TARGET_BOARD_ID,
             "itemName": item_name,
-            "columnValues": json.dumps(column_values)
+            "columnValues": _dumps(column_values)
         }
         
         if group_id:
             variables["groupId"] = group_id
         
         try:
-            result = self.client.execute_query(mutation, variables)
+            result = self._execute(CREATE_ITEM_MUTATION, variables)
             new_item_id = result.get("create_item", {}).get("id")
             
             if not new_item_id:
@@ -1330,25 +1988,22 @@ class BoardMerger:
                 })
                 return None
             
-            # Upload files to the created item
-            files_uploaded = 0
-            for file_info in file_columns:
-                if self.copy_file_to_item(
-                    file_info["asset_id"],
-                    new_item_id,
-                    file_info["target_col_id"],
-                    file_info["filename"]
-                ):
-                    files_uploaded += 1
-                time.sleep(0.3)  # Rate limit for file uploads
-            
+            # Upload files to the created item (in the background, see drain_file_copies)
             if file_columns:
-                self.log_entries.append({
-                    "action": "files_uploaded",
-                    "item_id": new_item_id,
-                    "uploaded": files_uploaded,
-                    "total": len(file_columns)
-                })
+                futures = [
+                    self.submit_file_copy(
+                        file_info["asset_id"],
+                        new_item_id,
+                        file_info["target_col_id"],
+                        file_info["filename"]
+                    )
+                    for file_info in file_columns
+                ]
+                with self._lock:
+                    self._pending_file_copies.append((new_item_id, futures))
+                    full = len(self._pending_file_copies) >= BATCH_SIZE
+                if full:
+                    self.drain_file_copies()
             
             # Set email columns separately
             for email_info in email_columns:
@@ -1356,7 +2011,7 @@ class BoardMerger:
                     new_item_id, 
                     TARGET_BOARD_ID,
                     email_info["target_col_id"],
-                    json.dumps({"email": email_info["email"], "text": email_info["email"]})
+                    _dumps({"email": email_info["email"], "text": email_info["email"]})
                 )
                 if not success:
                     self.log_entries.append({
@@ -1380,22 +2035,8 @@ class BoardMerger:
     
     def update_single_column(self, item_id: str, board_id: str, column_id: str, value: str) -> bool:
         """Update a single column value."""
-        mutation = """
-        mutation ChangeColumnValue($boardId: ID!, $itemId: ID!, $columnId: String!, $value: JSON!) {
-            change_column_value(
-                board_id: $boardId,
-                item_id: $itemId,
-                column_id: $columnId,
-                value: $value,
-                create_labels_if_missing: true
-            ) {
-                id
-            }
-        }
-        """
-        
         try:
-            self.client.execute_query(mutation, {
+            self._execute(CHANGE_COLUMN_VALUE_MUTATION, {
                 "boardId": board_id,
                 "itemId": item_id,
                 "columnId": column_id,
@@ -1415,6 +2056,11 @@ class BoardMerger:
         """Update existing item with new column values."""
         updates = []
         
+        # Column lookups for both items, built once instead of per mapping
+        source_index = self.index_source_item(item)
+        target_item = self.duplicate_index["items"].get(item_id)
+        target_index = _index_item(target_item) if target_item else {}
+        
         for mapping in mappings:
             source_col_id = mapping.get("source_column_id")
             target_col_id = mapping.get("target_column_id")
@@ -1425,77 +2071,19 @@ class BoardMerger:
                 continue
             
             # Get current target value
-            target_item = self.duplicate_index["items"].get(item_id)
-            target_col_value = None
-            if target_item:
-                target_col_value = self.get_column_value(target_item, target_col_id)
+            target_col_value = target_index.get(target_col_id)
             
             # Check if we should update
             if not self.should_update_column(merge_strategy, target_col_value):
                 continue
             
-            # Special handling for calculate_salary transformation
-            if transform == "calculate_salary":
-                target_col_type = "numbers"  # Gehalt is a numbers column
-                dummy_col_val = {"id": source_col_id, "text": "", "value": ""}
-                column_value = self.prepare_column_value(
-                    dummy_col_val, target_col_type, transform, item=item, mapping=mapping
-                )
-                if column_value:
-                    updates.append({
-                        "column_id": target_col_id,
-                        "value": column_value
-                    })
-                continue
-            
-            # Special handling for gender_to_salutation transformation
-            if transform == "gender_to_salutation":
-                target_col_type = "dropdown"  # Anrede is a dropdown column
-                dummy_col_val = {"id": source_col_id, "text": "", "value": ""}
+            # Transformations that build the value from the whole item
+            target_col_type = TRANSFORM_TARGET_TYPES.get(transform)
+            if target_col_type:
+                dummy_col_val = ColumnValue(source_col_id)
                 column_value = self.prepare_column_value(
-                    dummy_col_val, target_col_type, transform, item=item, mapping=mapping
-                )
-                if column_value:
-                    updates.append({
-                        "column_id": target_col_id,
-                        "value": column_value
-                    })
-                continue
-            
-            # Special handling for map_hours, map_languages, map_familienstand, map_nearest_city, and map_nationalitaet transformations
-            if transform in ("map_hours", "map_languages", "map_familienstand", "map_nearest_city", "map_nationalitaet"):
-                target_col_type = "dropdown"  # Both are dropdown columns
-                dummy_col_val = {"id": source_col_id, "text": "", "value": ""}
-                column_value = self.prepare_column_value(
-                    dummy_col_val, target_col_type, transform, item=item, mapping=mapping
-                )
-                if column_value:
-                    updates.append({
-                        "column_id": target_col_id,
-                        "value": column_value
-                    })
-                continue
-            
-            # Special handling for parse_number transformation
-            if transform == "parse_number":
-                target_col_type = "numbers"  # Kinder is a numbers column
-                dummy_col_val = {"id": source_col_id, "text": "", "value": ""}
-                column_value = self.prepare_column_value(
-                    dummy_col_val, target_col_type, transform, item=item, mapping=mapping
-                )
-                if column_value:
-                    updates.append({
-                        "column_id": target_col_id,
-                        "value": column_value
-                    })
-                continue
-            
-            # Special handling for map_country transformation
-            if transform == "map_country":
-                target_col_type = "dropdown"  # Geburtsland is a dropdown column
-                dummy_col_val = {"id": source_col_id, "text": "", "value": ""}
-                column_value = self.prepare_column_value(
-                    dummy_col_val, target_col_type, transform, item=item, mapping=mapping
+                    dummy_col_val, target_col_type, transform, item=item, mapping=mapping,
+                    board_id=target_board_id
                 )
                 if column_value:
                     updates.append({
@@ -1505,13 +2093,14 @@ class BoardMerger:
                 continue
             
             # Standard handling for other columns
-            source_col_val = self.get_column_value(item, source_col_id)
+            source_col_val = source_index.get(source_col_id)
             if not source_col_val:
                 continue
             
             target_col_type = "text"  # Would need to fetch from board structure
             column_value = self.prepare_column_value(
-                source_col_val, target_col_type, transform, item=item, mapping=mapping
+                source_col_val, target_col_type, transform, item=item, mapping=mapping,
+                board_id=target_board_id
             )
             
             if column_value:
@@ -1523,22 +2112,12 @@ class BoardMerger:
         if not updates:
             return
         
-        # Batch update mutations
+        # All columns in one mutation
+        if self.change_multiple_column_values(item_id, target_board_id, updates):
+            return
+        
+        # Retry column by column so a single bad value does not drop the others
         for update in updates:
-            mutation = """
-            mutation ChangeColumnValue($boardId: ID!, $itemId: ID!, $columnId: String!, $value: JSON!) {
-                change_column_value(
-                    board_id: $boardId,
-                    item_id: $itemId,
-                    column_id: $columnId,
-                    value: $value,
-                    create_labels_if_missing: true
-                ) {
-                    id
-                }
-            }
-            """
-            
             variables = {
                 "boardId": target_board_id,
                 "itemId": item_id,
@@ -1547,8 +2126,7 @@ class BoardMerger:
             }
             
             try:
-                self.client.execute_query(mutation, variables)
-                time.sleep(0.2)  # Rate limit protection
+                self._execute(CHANGE_COLUMN_VALUE_MUTATION, variables)
             except Exception as e:
                 self.log_entries.append({
                     "action": "update_error",
@@ -1558,15 +2136,49 @@ class BoardMerger:
                     "error": str(e)
                 })
     
+    def change_multiple_column_values(self, item_id: str, board_id: str, updates: List[Dict]) -> bool:
+        """
+        Write all prepared column updates of an item with one mutation.
+        
+        Args:
+            updates: List of {"column_id": ..., "value": ...} as built by update_item,
+                     values in change_column_value (JSON string) form
+        
+        Returns:
+            True if the mutation succeeded
+        """
+        column_values = {
+            update["column_id"]: _multi_column_value(update["value"]) for update in updates
+        }
+        variables = {
+            "boardId": board_id,
+            "itemId": item_id,
+            "columnValues": _dumps(column_values)
+        }
+        
+        try:
+            self._execute(CHANGE_MULTIPLE_COLUMN_VALUES_MUTATION, variables)
+            return True
+        except Exception as e:
+            self.log_entries.append({
+                "action": "batch_update_error",
+                "item_id": item_id,
+                "board_id": board_id,
+                "column_ids": list(column_values),
+                "error": str(e)[:200]
+            })
+            return False
+    
     def process_item(self, item: Dict, default_mappings: List[Dict], 
                     email_col_id: str, hf4u_col_id: str, 
                     candidate_id_col_id: Optional[str] = None):
         """Process a single item (create or update)."""
         item_name = item.get("name", "")
+        self.index_source_item(item)
         
         # Check for duplicate
-        duplicate_match = find_duplicate(
-            item, self.duplicate_index, email_col_id, hf4u_col_id, candidate_id_col_id
+        duplicate_match = self.find_duplicate_match(
+            item, email_col_id, hf4u_col_id, candidate_id_col_id
         )
 
         # Name-only ambiguity: do NOT match, but log so we can investigate
@@ -1596,8 +2208,7 @@ class BoardMerger:
             
             # Move source item to duplicate group if configured
             if self.duplicate_group_id:
-                if self.move_item_to_group(source_item_id, SOURCE_BOARD_ID, self.duplicate_group_id):
-                    self.stats["moved_duplicates"] += 1
+                self.queue_move_item_to_group(source_item_id, self.duplicate_group_id, "moved_duplicates")
             
             # Link source item to the found duplicate via board-relation column
             self.link_source_to_duplicate(source_item_id, target_item_id)
@@ -1608,7 +2219,7 @@ class BoardMerger:
             # Transfer updates
             self.transfer_updates(item, target_item_id)
             
-            self.stats["updated"] += 1
+            self.count("updated")
             self.log_entries.append({
                 "action": "update",
                 "item_name": item_name,
@@ -1625,8 +2236,7 @@ class BoardMerger:
                 # Move source item to "Neu" group if configured
                 source_item_id = item.get("id")
                 if self.new_group_id:
-                    if self.move_item_to_group(source_item_id, SOURCE_BOARD_ID, self.new_group_id):
-                        self.stats["moved_new"] += 1
+                    self.queue_move_item_to_group(source_item_id, self.new_group_id, "moved_new")
                 
                 # Link source item to the newly created item via board-relation column
                 self.link_source_to_duplicate(source_item_id, new_item_id)
@@ -1634,7 +2244,7 @@ class BoardMerger:
                 # Transfer updates
                 self.transfer_updates(item, new_item_id)
                 
-                self.stats["created"] += 1
+                self.count("created")
                 self.log_entries.append({
                     "action": "create",
                     "item_name": item_name,
@@ -1643,7 +2253,12 @@ class BoardMerger:
                     "moved_to_new": bool(self.new_group_id)
                 })
             else:
-                self.stats["errors"] += 1
+                self.count("errors")
+    
+    def fetch_source_page(self, cursor: Optional[str] = None) -> Dict:
+        """Fetch one page of source board items within the API rate limit."""
+        self._limiter.acquire(5)  # Full item pages are expensive queries
+        return self.client.get_all_items_paginated(SOURCE_BOARD_ID, cursor=cursor)
     
     def merge_boards(self, email_col_id: str, hf4u_col_id: str, 
                     candidate_id_col_id: Optional[str] = None,
@@ -1662,58 +2277,80 @@ class BoardMerger:
         if dry_run:
             print("\n[DRY RUN MODE - No changes will be made]")
         
-        cursor = None
         page = 1
         processed = 0
+        # Bound once for the per-item dry-run loop
+        log = self.log_entries.append
+        stats = self.stats
+        # Pages are fetched one ahead, so the next page loads while this one is processed
+        page_pool = ThreadPoolExecutor(max_workers=1)
+        next_page = page_pool.submit(self.fetch_source_page)
         
-        while True:
-            print(f"\nProcessing page {page}...", end=" ", flush=True)
-            result = self.client.get_all_items_paginated(SOURCE_BOARD_ID, cursor=cursor)
-            items = result.get("items", [])
-            
-            if not items:
-                break
-            
-            for item in items:
-                if limit and processed >= limit:
+        try:
+            while next_page is not None:
+                result = next_page.result()
+                next_page = None
+                items = result.get("items", [])
+                
+                if not items:
                     break
                 
+                page_items = items[:limit - processed] if limit else items
+                
+                cursor = result.get("cursor")
+                if cursor and not (limit and processed + len(page_items) >= limit):
+                    next_page = page_pool.submit(self.fetch_source_page, cursor)
+                
                 if not dry_run:
-                    self.process_item(item, default_mappings, email_col_id, hf4u_col_id, candidate_id_col_id)
-                else:
-                    # Dry run: just check for duplicates
-                    duplicate_match = find_duplicate(
-                        item, self.duplicate_index, email_col_id, hf4u_col_id, candidate_id_col_id
+                    self.prefetch_lookups(
+                        page_items, default_mappings, email_col_id, hf4u_col_id, candidate_id_col_id
                     )
-                    if duplicate_match and duplicate_match.get("match_type") == "name_only_ambiguous":
-                        # Don't treat ambiguous name-only as a duplicate; count as create
-                        self.log_entries.append({
-                            "action": "name_match_ambiguous",
-                            "item_name": item.get("name", ""),
-                            "source_item_id": duplicate_match.get("source_item_id") or item.get("id"),
-                            "normalized_name": duplicate_match.get("normalized_name"),
-                            "candidates": duplicate_match.get("candidates", [])
-                        })
-                        duplicate_match = None
-                    if duplicate_match:
-                        self.stats["updated"] += 1
-                    else:
-                        self.stats["created"] += 1
+                    # Items are independent and I/O-bound, so process the page concurrently
+                    with ThreadPoolExecutor(max_workers=ITEM_WORKERS) as item_pool:
+                        list(item_pool.map(
+                            lambda item: self.process_item(
+                                item, default_mappings, email_col_id, hf4u_col_id, candidate_id_col_id
+                            ),
+                            page_items
+                        ))
                 
-                processed += 1
+                for item in page_items:
+                    if dry_run:
+                        # Dry run: just check for duplicates
+                        duplicate_match = self.find_duplicate_match(
+                            item, email_col_id, hf4u_col_id, candidate_id_col_id
+                        )
+                        if duplicate_match and duplicate_match.get("match_type") == "name_only_ambiguous":
+                            # Don't treat ambiguous name-only as a duplicate; count as create
+                            log({
+                                "action": "name_match_ambiguous",
+                                "item_name": item.get("name", ""),
+                                "source_item_id": duplicate_match.get("source_item_id") or item.get("id"),
+                                "normalized_name": duplicate_match.get("normalized_name"),
+                                "candidates": duplicate_match.get("candidates", [])
+                            })
+                            duplicate_match = None
+                        if duplicate_match:
+                            stats["updated"] += 1
+                        else:
+                            stats["created"] += 1
+                    
+                    processed += 1
                 
-                if processed % 100 == 0:
-                    print(f"\n  Processed {processed} items...", end=" ", flush=True)
-            
-            if limit and processed >= limit:
-                break
-            
-            cursor = result.get("cursor")
-            if not cursor:
-                break
-            
-            page += 1
-            time.sleep(0.5)  # Rate limit protection
+                # One progress line per page (pages are processed as a whole)
+                if limit:
+                    print(f"\nProcessed page {page}: {processed}/{limit} items ({processed * 100 // limit}%)")
+                else:
+                    print(f"\nProcessed page {page}: {processed} items")
+                
+                page += 1
+        finally:
+            # Also on errors: queued moves/updates belong to items already processed
+            page_pool.shutdown()
+            try:
+                self.flush_pending_mutations()
+            finally:
+                self._file_pool.shutdown(wait=True)
         
         # Print summary
         print(f"\n\n{'='*60}")
@@ -1768,9 +2405,9 @@ def main():
             mapping_configs[TARGET_BOARD_ID] = yaml.safe_load(f)
             print(f"  Using fallback mapping: {args.mapping}")
     
-    # Load duplicate index
-    with open(args.index, 'r', encoding='utf-8') as f:
-        duplicate_index = json.load(f)
+    # Load duplicate index (orjson if installed; it is the bulk of startup time)
+    with open(args.index, 'rb') as f:
+        duplicate_index = _loads(f.read())
     
     client = MondayAPIClient(api_token)
     
@@ -1791,7 +2428,8 @@ def main():
     # Use hardcoded NEW_GROUP_ID for "Neu" group
     print(f"  Using 'Neu' group: {NEW_GROUP_ID}")
     
-    merger = BoardMerger(client, mapping_configs, duplicate_index, duplicate_group_id, NEW_GROUP_ID)
+    merger = BoardMerger(client, mapping_configs, duplicate_index, duplicate_group_id, NEW_GROUP_ID,
+                         source_columns=source_board_info.get("columns", []))
     
     # Run merge
     stats, log_entries = merger.merge_boards(
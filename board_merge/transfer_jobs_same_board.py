@@ -9,25 +9,107 @@ to target job values (dropdown_mkws141v) using the mapping YAML file.
 import os
 import sys
 import json
+import sqlite3
 import yaml
 import time
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from typing import Any, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 from export_boards import MondayAPIClient
 
+try:
+    import orjson
+except ImportError:  # optional speedup, falls back to the stdlib json module
+    orjson = None
+
 # Board ID (same for source and target)
 BOARD_ID = "9661290405"
 SOURCE_COLUMN_ID = "dropdown_mktvs1mm"  # HR4You - Jobs
 TARGET_COLUMN_ID = "dropdown_mkws141v"  # ➡️ Jobs
 
-# Batch size for mutations
+# Only fetch items that have a source value (filtered server-side)
+ITEMS_QUERY = {"rules": [{"column_id": SOURCE_COLUMN_ID, "compare_value": [], "operator": "is_not_empty"}]}
+
+# Batch size for mutations (change_column_value calls per request). The
+# batch size adapts between MIN_BATCH_SIZE and BATCH_SIZE: halved when a batch
+# times out, grown by BATCH_SIZE_STEP after BATCH_GROW_AFTER good batches.
 BATCH_SIZE = 50
+MIN_BATCH_SIZE = 5
+BATCH_SIZE_STEP = 5
+BATCH_GROW_AFTER = 5
+
+# JSON coding for column values and mutation payloads (orjson when installed)
+if orjson is not None:
+    _loads = orjson.loads
+    
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    _loads = json.loads
+    _dumps = json.dumps
+
+CHANGE_COLUMN_VALUE_MUTATION = """
+mutation ChangeColumnValue($boardId: ID!, $itemId: ID!, $columnId: String!, $value: JSON!) {
+    change_column_value(
+        board_id: $boardId,
+        item_id: $itemId,
+        column_id: $columnId,
+        value: $value
+    ) {
+        id
+    }
+}
+"""
+
+
+@lru_cache(maxsize=1024)
+def encode_dropdown_ids(option_ids: Tuple[str, ...]) -> str:
+    """Dropdown column value for the given option IDs: {"ids": [option_id1, ...]}."""
+    return _dumps({"ids": list(option_ids)})
+
+
+class CursorExpired(Exception):
+    """The items page cursor expired; paging has to restart from the first page."""
+
+
+def retry_on_timeout(max_retries: int = 3):
+    """
+    Retry a Monday.com API call on server timeouts.
+    
+    Timeouts (504 / Gateway Timeout / HTTPError) are retried with a growing wait
+    (5s, 10s, ...) up to max_retries attempts. An expired cursor is raised as
+    CursorExpired; any other error is re-raised unchanged.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            retry_count = 0
+            while True:
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    error_msg = str(e)
+                    if "CursorExpiredError" in error_msg or "CursorException" in error_msg:
+                        raise CursorExpired(error_msg) from e
+                    if "504" not in error_msg and "Gateway Timeout" not in error_msg and "HTTPError" not in error_msg:
+                        raise
+                    retry_count += 1
+                    if retry_count >= max_retries:
+                        print(f"\n  Max retries reached. Saving progress and exiting.")
+                        raise
+                    wait_time = retry_count * 5
+                    print(f"\n  Server timeout (attempt {retry_count}/{max_retries}). Waiting {wait_time}s...")
+                    time.sleep(wait_time)
+        return wrapper
+    return decorator
 
 
 class JobsTransfer:
     """Handles job value transfer within the same board."""
     
-    def __init__(self, client: MondayAPIClient, mapping_config: Dict, board_columns: Dict):
+    def __init__(self, client: MondayAPIClient, mapping_config: Dict, board_columns: Dict,
+                 state_path: Optional[str] = None, batch_size: int = BATCH_SIZE):
         self.client = client
         self.mapping_config = mapping_config
         self.board_columns = board_columns
@@ -36,13 +118,27 @@ class JobsTransfer:
             "updated": 0,
             "skipped": 0,
             "errors": 0,
-            "no_mapping": 0
+            "no_mapping": 0,
+            "already_written": 0
         }
         self.log_entries = []
+        # Column updates waiting to be sent as one batch: (item_id, value, log entry)
+        self._pending_updates = []
+        self.batch_size = max(MIN_BATCH_SIZE, min(batch_size, BATCH_SIZE))
+        self._good_batches = 0  # batches sent without timeout since the last resize
+        
+        # item_id -> column value written, so items seen again (after a cursor
+        # restart, or in a resumed run with a state file) are not updated twice
+        self._written = {}
+        self._state = None
+        if state_path:
+            self._open_state(state_path)
         
         # Build mapping dictionaries
         self.source_value_to_target_value = {}
         self.target_value_to_option_id = {}
+        # Source values (as found on an item) -> (target values, unmapped values)
+        self._mapped_values_cache = {}
         
         # Build source_value -> target_value mapping
         for mapping in mapping_config.get("mappings", []):
@@ -54,6 +150,22 @@ class JobsTransfer:
         # Build target_value -> option_id mapping from column definition
         self._build_target_option_mapping()
     
+    def _open_state(self, state_path: str):
+        """Open (or create) the state file of written items and load it."""
+        self._state = sqlite3.connect(state_path)
+        self._state.execute("PRAGMA journal_mode=WAL")
+        self._state.execute("PRAGMA synchronous=NORMAL")
+        self._state.execute("CREATE TABLE IF NOT EXISTS done (item_id TEXT PRIMARY KEY, value TEXT)")
+        self._written.update(self._state.execute("SELECT item_id, value FROM done"))
+        print(f"Loaded {len(self._written)} already written items from {state_path}")
+    
+    def _record_written(self, written: List[Tuple[str, str]]):
+        """Remember successfully written (item_id, value) pairs."""
+        self._written.update(written)
+        if self._state and written:
+            self._state.executemany("INSERT OR REPLACE INTO done (item_id, value) VALUES (?, ?)", written)
+            self._state.commit()
+    
     def _build_target_option_mapping(self):
         """Build mapping from target value label to option ID."""
         # Find target column in board columns
@@ -77,7 +189,7 @@ class JobsTransfer:
                 label_id = label.get("id")
                 label_name = label.get("name", "").strip()
                 if label_id and label_name:
-                    self.target_value_to_option_id[label_name] = label_id
+                    self.target_value_to_option_id[label_name] = str(label_id)
             
             print(f"Loaded {len(self.target_value_to_option_id)} target option mappings")
         except Exception as e:
@@ -94,40 +206,27 @@ class JobsTransfer:
             if text:
                 return text
         
-        # Try to parse value JSON
-        value = col_value.get("value", "")
-        if value:
-            try:
-                value_data = json.loads(value) if isinstance(value, str) else value
-                if isinstance(value_data, dict):
-                    # Dropdown values have structure like {"ids": [1, 2]}
-                    ids = value_data.get("ids", [])
-                    if ids:
-                        # We need to look up the label name from the source column
-                        # For now, return None and we'll use text field
-                        pass
-            except:
-                pass
-        
+        # The value JSON only holds option IDs ({"ids": [1, 2]}); resolving them
+        # would need the source column's labels, so without text there is no value.
+        # (It is not parsed here: nothing would be read from it.)
         return None
     
-    def get_source_column_values(self, item: Dict) -> List[str]:
-        """Get the source job values from item (can be multiple, comma-separated)."""
-        for col_val in item.get("column_values", []):
-            if col_val.get("id") == SOURCE_COLUMN_ID:
-                value = self.get_dropdown_value(col_val)
-                if value:
-                    # Split by comma and strip whitespace
-                    values = [v.strip() for v in value.split(",") if v.strip()]
-                    return values
+    @staticmethod
+    def index_columns(item: Dict) -> Dict[str, Dict]:
+        """Column values of an item by column ID."""
+        return {col_val.get("id"): col_val for col_val in item.get("column_values", [])}
+    
+    def get_source_column_values(self, columns: Dict[str, Dict]) -> List[str]:
+        """Get the source job values from an item's columns (can be multiple, comma-separated)."""
+        value = self.get_dropdown_value(columns.get(SOURCE_COLUMN_ID))
+        if value:
+            # Split by comma and strip whitespace
+            return [v.strip() for v in value.split(",") if v.strip()]
         return []
     
-    def get_target_column_value(self, item: Dict) -> Optional[Dict]:
-        """Get the target column value from item."""
-        for col_val in item.get("column_values", []):
-            if col_val.get("id") == TARGET_COLUMN_ID:
-                return col_val
-        return None
+    def get_target_column_value(self, columns: Dict[str, Dict]) -> Optional[Dict]:
+        """Get the target column value from an item's columns."""
+        return columns.get(TARGET_COLUMN_ID)
     
     def is_target_empty(self, target_col_value: Optional[Dict]) -> bool:
         """Check if target column is empty."""
@@ -141,7 +240,7 @@ class JobsTransfer:
         value = target_col_value.get("value", "")
         if value:
             try:
-                value_data = json.loads(value) if isinstance(value, str) else value
+                value_data = _loads(value) if isinstance(value, str) else value
                 if isinstance(value_data, dict):
                     ids = value_data.get("ids", [])
                     return not ids
@@ -150,8 +249,14 @@ class JobsTransfer:
         
         return True
     
-    def update_item_job(self, item_id: str, target_values: List[str], dry_run: bool = False):
-        """Update item's target job column with new values (can be multiple)."""
+    def update_item_job(self, item_id: str, target_values: List[str], dry_run: bool = False,
+                        log_entry: Optional[Dict] = None):
+        """
+        Update item's target job column with new values (can be multiple).
+        
+        The update is queued and sent with others in one request (see
+        flush_updates); log_entry is logged once it has been applied.
+        """
         # Get option IDs for all target values
         option_ids = []
         missing_values = []
@@ -159,7 +264,7 @@ class JobsTransfer:
         for target_value in target_values:
             option_id = self.target_value_to_option_id.get(target_value)
             if option_id:
-                option_ids.append(str(option_id))
+                option_ids.append(option_id)
             else:
                 missing_values.append(target_value)
         
@@ -175,27 +280,101 @@ class JobsTransfer:
         if not option_ids:
             return False
         
+        # Items with the same set of jobs share one encoded value
+        column_value = encode_dropdown_ids(tuple(option_ids))
+        
+        if self._written.get(item_id) == column_value:
+            self.stats["already_written"] += 1
+            return False
+        
         if dry_run:
             self.stats["updated"] += 1
+            if log_entry:
+                self.log_entries.append(log_entry)
             return True
         
-        # Prepare mutation
-        mutation = """
-        mutation ChangeColumnValue($boardId: ID!, $itemId: ID!, $columnId: String!, $value: JSON!) {
-            change_column_value(
-                board_id: $boardId,
-                item_id: $itemId,
-                column_id: $columnId,
-                value: $value
-            ) {
-                id
-            }
-        }
+        self._pending_updates.append((item_id, column_value, log_entry))
+        if len(self._pending_updates) >= self.batch_size:
+            self.flush_updates()
+        return True
+    
+    def flush_updates(self):
+        """Send all queued column updates, batch_size updates per request."""
+        pending, self._pending_updates = self._pending_updates, []
+        while pending:
+            chunk = pending[:self.batch_size]
+            if self._send_batch(chunk):
+                pending = pending[len(chunk):]
+    
+    def _send_batch(self, chunk: List[Tuple[str, str, Optional[Dict]]]) -> bool:
         """
+        Send queued column updates as one aliased mutation.
         
-        # Dropdown values need format: {"ids": [option_id1, option_id2, ...]}
-        column_value = json.dumps({"ids": option_ids})
+        Returns:
+            False if the request timed out and the batch size was reduced; the
+            caller sends the same updates again in smaller batches
+        """
+        # mutation ChangeJobs(...) { m0: change_column_value(...) { id } m1: ... }
+        var_defs = ["$boardId: ID!", "$columnId: String!"]
+        fields = []
+        variables = {"boardId": BOARD_ID, "columnId": TARGET_COLUMN_ID}
+        for i, (item_id, column_value, _) in enumerate(chunk):
+            var_defs.append(f"$itemId{i}: ID!, $value{i}: JSON!")
+            fields.append(
+                f"m{i}: change_column_value(board_id: $boardId, item_id: $itemId{i}, "
+                f"column_id: $columnId, value: $value{i}) {{ id }}"
+            )
+            variables[f"itemId{i}"] = item_id
+            variables[f"value{i}"] = column_value
+        mutation = f"mutation ChangeJobs({', '.join(var_defs)}) {{ {' '.join(fields)} }}"
         
+        try:
+            result = self.client.execute_query(mutation, variables)
+            results = [bool((result.get(f"m{i}") or {}).get("id")) for i in range(len(chunk))]
+            for (item_id, _, _), success in zip(chunk, results):
+                if not success:
+                    self.log_entries.append({
+                        "action": "update_error",
+                        "item_id": item_id,
+                        "error": "No item ID returned"
+                    })
+            
+            self._good_batches += 1
+            if self._good_batches >= BATCH_GROW_AFTER and self.batch_size < BATCH_SIZE:
+                self.batch_size = min(BATCH_SIZE, self.batch_size + BATCH_SIZE_STEP)
+                self._good_batches = 0
+        except Exception as e:
+            error_msg = str(e)
+            if ("504" in error_msg or "Gateway Timeout" in error_msg) and self.batch_size > MIN_BATCH_SIZE:
+                # Too much work for one request: retry with smaller batches
+                self.batch_size = max(MIN_BATCH_SIZE, self.batch_size // 2)
+                self._good_batches = 0
+                print(f"\n  Batch timed out. Reducing batch size to {self.batch_size}...")
+                return False
+            
+            # Retry one by one so a single bad item does not fail the whole batch
+            self.log_entries.append({
+                "action": "batch_update_error",
+                "count": len(chunk),
+                "error": error_msg
+            })
+            results = [self._change_column_value(item_id, column_value)
+                       for item_id, column_value, _ in chunk]
+        
+        written = []
+        for (item_id, column_value, log_entry), success in zip(chunk, results):
+            if success:
+                self.stats["updated"] += 1
+                written.append((item_id, column_value))
+                if log_entry:
+                    self.log_entries.append(log_entry)
+            else:
+                self.stats["errors"] += 1
+        self._record_written(written)
+        return True
+    
+    def _change_column_value(self, item_id: str, column_value: str) -> bool:
+        """Update the target column of a single item."""
         variables = {
             "boardId": BOARD_ID,
             "itemId": item_id,
@@ -204,12 +383,9 @@ class JobsTransfer:
         }
         
         try:
-            self.client.execute_query(mutation, variables)
-            self.stats["updated"] += 1
-            time.sleep(0.2)  # Rate limit protection
+            self.client.execute_query(CHANGE_COLUMN_VALUE_MUTATION, variables)
             return True
         except Exception as e:
-            self.stats["errors"] += 1
             self.log_entries.append({
                 "action": "update_error",
                 "item_id": item_id,
@@ -217,27 +393,46 @@ class JobsTransfer:
             })
             return False
     
+    def map_source_values(self, source_values: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Map source job values to target values.
+        
+        Returns:
+            (target values, source values without a mapping); memoized per
+            combination of source values, which recurs across many items
+        """
+        key = tuple(source_values)
+        cached = self._mapped_values_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        target_values = []
+        unmapped_values = []
+        
+        for source_value in source_values:
+            target_value = self.source_value_to_target_value.get(source_value)
+            if target_value:
+                target_values.append(target_value)
+            else:
+                unmapped_values.append(source_value)
+        
+        cached = self._mapped_values_cache[key] = (target_values, unmapped_values)
+        return cached
+    
     def process_item(self, item: Dict, dry_run: bool = False):
         """Process a single item."""
         item_id = item.get("id")
         item_name = item.get("name", "")
+        columns = self.index_columns(item)
         
         # Get source job values (can be multiple)
-        source_values = self.get_source_column_values(item)
+        source_values = self.get_source_column_values(columns)
         if not source_values:
             self.stats["skipped"] += 1
             return
         
         # Map each source value to target value
-        target_values = []
-        unmapped_values = []
-        
-        for source_value in source_values:
-            target_value = self.source_value_to_target_value.get(source_value)
-            if target_value and target_value != "":
-                target_values.append(target_value)
-            else:
-                unmapped_values.append(source_value)
+        target_values, unmapped_values = self.map_source_values(source_values)
         
         # Log unmapped values
         if unmapped_values:
@@ -257,22 +452,34 @@ class JobsTransfer:
         
         # Check if target column is empty (since merge_strategy is overwrite, we always update)
         # But we can still check for logging
-        target_col_value = self.get_target_column_value(item)
+        target_col_value = self.get_target_column_value(columns)
         target_empty = self.is_target_empty(target_col_value)
         
-        # Update item with all target values
-        success = self.update_item_job(item_id, target_values, dry_run)
+        # Update item with all target values (logged once the update is applied)
+        self.update_item_job(item_id, target_values, dry_run, log_entry={
+            "action": "update" if not dry_run else "would_update",
+            "item_id": item_id,
+            "item_name": item_name,
+            "source_values": source_values,
+            "target_values": target_values,
+            "unmapped_values": unmapped_values if unmapped_values else None,
+            "target_was_empty": target_empty
+        })
+    
+    @retry_on_timeout()
+    def fetch_page(self, cursor: Optional[str]) -> Dict:
+        """
+        Fetch one page of board items.
         
-        if success:
-            self.log_entries.append({
-                "action": "update" if not dry_run else "would_update",
-                "item_id": item_id,
-                "item_name": item_name,
-                "source_values": source_values,
-                "target_values": target_values,
-                "unmapped_values": unmapped_values if unmapped_values else None,
-                "target_was_empty": target_empty
-            })
+        Raises:
+            CursorExpired: if the cursor expired and paging has to restart
+        """
+        if cursor:
+            time.sleep(0.5)  # Rate limit protection
+        
+        return self.client.get_all_items_paginated(
+            BOARD_ID, cursor=cursor, include_updates=False, query_params=ITEMS_QUERY
+        )
     
     def transfer_jobs(self, limit: Optional[int] = None, dry_run: bool = False):
         """Main transfer process."""
@@ -287,70 +494,51 @@ class JobsTransfer:
         if dry_run:
             print("\n[DRY RUN MODE - No changes will be made]")
         
-        cursor = None
         page = 1
         processed = 0
         
-        while True:
-            print(f"\nProcessing page {page}...", end=" ", flush=True)
-            max_retries = 3
-            retry_count = 0
-            result = None
+        # Pages are fetched one ahead, so the next page loads while this one is processed
+        with ThreadPoolExecutor(max_workers=1) as page_pool:
+            next_page = page_pool.submit(self.fetch_page, None)
             
-            while retry_count < max_retries:
+            while True:
                 try:
-                    result = self.client.get_all_items_paginated(BOARD_ID, cursor=cursor)
+                    result = next_page.result()
+                except CursorExpired:
+                    print(f"\n  Cursor expired. Restarting from beginning (processed {processed} items so far)...")
+                    page = 1
+                    # Continue processing - items already written in this run are skipped
+                    next_page = page_pool.submit(self.fetch_page, None)
+                    continue
+                
+                items = result.get("items", [])
+                
+                if not items:
                     break
-                except Exception as e:
-                    error_msg = str(e)
-                    if "CursorExpiredError" in error_msg or "CursorException" in error_msg:
-                        print(f"\n  Cursor expired. Restarting from beginning (processed {processed} items so far)...")
-                        cursor = None
-                        page = 1
-                        # Continue processing - items already updated won't be updated again due to overwrite strategy
-                        result = None
+                
+                cursor = result.get("cursor")
+                if cursor and not (limit and processed + len(items) >= limit):
+                    next_page = page_pool.submit(self.fetch_page, cursor)
+                
+                for item in items:
+                    if limit and processed >= limit:
                         break
-                    elif "504" in error_msg or "Gateway Timeout" in error_msg or "HTTPError" in error_msg:
-                        retry_count += 1
-                        if retry_count < max_retries:
-                            wait_time = retry_count * 5
-                            print(f"\n  Server timeout (attempt {retry_count}/{max_retries}). Waiting {wait_time}s...")
-                            time.sleep(wait_time)
-                            continue
-                        else:
-                            print(f"\n  Max retries reached. Saving progress and exiting.")
-                            raise
-                    else:
-                        raise
-            
-            if result is None:
-                continue
-            
-            items = result.get("items", [])
-            
-            if not items:
-                break
-            
-            for item in items:
+                    
+                    self.process_item(item, dry_run)
+                    processed += 1
+                    self.stats["processed"] += 1
+                
+                # Send this page's remaining updates before moving on to the next one
+                self.flush_updates()
+                print(f"\nProcessed page {page}: {processed} items")
+                
                 if limit and processed >= limit:
                     break
                 
-                self.process_item(item, dry_run)
-                processed += 1
-                self.stats["processed"] += 1
+                if not cursor:
+                    break
                 
-                if processed % 100 == 0:
-                    print(f"\n  Processed {processed} items...", end=" ", flush=True)
-            
-            if limit and processed >= limit:
-                break
-            
-            cursor = result.get("cursor")
-            if not cursor:
-                break
-            
-            page += 1
-            time.sleep(0.5)  # Rate limit protection
+                page += 1
         
         # Print summary
         print(f"\n\n{'='*60}")
@@ -359,6 +547,7 @@ class JobsTransfer:
         print(f"  Updated: {self.stats['updated']}")
         print(f"  Skipped (no source value): {self.stats['skipped']}")
         print(f"  No mapping found: {self.stats['no_mapping']}")
+        print(f"  Already written (skipped): {self.stats['already_written']}")
         print(f"  Errors: {self.stats['errors']}")
         print(f"{'='*60}")
         
@@ -375,6 +564,9 @@ def main():
     parser.add_argument("--limit", type=int, help="Limit number of items to process (for testing)")
     parser.add_argument("--dry-run", action="store_true", help="Dry run mode (no changes)")
     parser.add_argument("--log", help="Log file path")
+    parser.add_argument("--state", help="SQLite file recording written items, to resume an interrupted run")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE,
+                       help=f"Initial updates per request ({MIN_BATCH_SIZE}-{BATCH_SIZE}, adapts to timeouts)")
     
     args = parser.parse_args()
     
@@ -395,7 +587,8 @@ def main():
     
     client = MondayAPIClient(api_token)
     
-    transfer = JobsTransfer(client, mapping_config, board_columns)
+    transfer = JobsTransfer(client, mapping_config, board_columns, state_path=args.state,
+                            batch_size=args.batch_size)
     
     # Run transfer
     try:
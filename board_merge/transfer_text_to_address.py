@@ -9,13 +9,23 @@ Converts plain text to Monday.com address format.
 import os
 import sys
 import json
+import re
+import sqlite3
 import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+import requests
 from dotenv import load_dotenv
 from export_boards import MondayAPIClient
 
+try:
+    import orjson
+except ImportError:  # optional speedup, falls back to the stdlib json module
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
@@ -60,7 +70,30 @@ GERMAN_CITY_COORDS = {
 # Default coordinates for Germany (center)
 DEFAULT_GERMANY_COORDS = (51.1657, 10.4515)
 
+# Geocoding of texts without a known city (optional, see Geocoder)
+NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+GEOCODER_USER_AGENT = "FInal_merger-transfer_text_to_address/1.0"
+GEOCODER_MIN_INTERVAL = 1.0  # seconds between requests (Nominatim usage policy)
+
+# JSON coding for column values and mutation payloads (orjson when installed)
+if orjson is not None:
+    _loads = orjson.loads
+    
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    _loads = json.loads
+    _dumps = json.dumps
+
+# All known cities in one pattern. The lookahead reports a match at every
+# position, so overlapping names are found too; longest names first so a
+# city that starts like another one is not cut short.
+_CITY_RE = re.compile("(?=({}))".format(
+    "|".join(re.escape(city) for city in sorted(GERMAN_CITY_COORDS, key=len, reverse=True))
+))
 
+
+@lru_cache(maxsize=4096)
 def extract_city_from_text(text: str) -> Optional[str]:
     """
     Extract city name from address text.
@@ -71,11 +104,13 @@ def extract_city_from_text(text: str) -> Optional[str]:
     Returns:
         City name if found, None otherwise
     """
-    text_lower = text.lower()
+    found = {match.group(1) for match in _CITY_RE.finditer(text.lower())}
+    if not found:
+        return None
     
-    # Check each known city
-    for city in GERMAN_CITY_COORDS.keys():
-        if city in text_lower:
+    # Several cities in the text: the first in GERMAN_CITY_COORDS wins
+    for city in GERMAN_CITY_COORDS:
+        if city in found:
             return city
     
     return None
@@ -92,27 +127,29 @@ def get_coordinates_for_text(text: str) -> Tuple[float, float]:
     Returns:
         Tuple of (lat, lng)
     """
-    city = extract_city_from_text(text)
-    if city:
-        return GERMAN_CITY_COORDS[city]
-    return DEFAULT_GERMANY_COORDS
+    # No city found (None) falls through to the default
+    return GERMAN_CITY_COORDS.get(extract_city_from_text(text), DEFAULT_GERMANY_COORDS)
 
 
-def text_to_address_json(text: str, country_id: int = 82) -> str:
+@lru_cache(maxsize=4096)
+def text_to_address_json(text: str, country_id: int = 82,
+                         coords: Optional[Tuple[float, float]] = None) -> str:
     """
     Convert plain text to Monday.com location column JSON format.
     
     Monday.com location columns require lat/lng coordinates.
     Uses known city coordinates or falls back to Germany center.
+    Cached, since many items share the same location text.
     
     Args:
         text: Plain text location (e.g., "Berlin", "12345 München")
         country_id: Monday.com country ID (82 = Germany, unused but kept for compatibility)
+        coords: Coordinates to use instead of the known-city lookup (e.g. geocoded)
         
     Returns:
         JSON string in location column format
     """
-    lat, lng = get_coordinates_for_text(text)
+    lat, lng = coords or get_coordinates_for_text(text)
     
     # Monday.com location columns require lat, lng, and address
     address_data = {
@@ -120,15 +157,74 @@ def text_to_address_json(text: str, country_id: int = 82) -> str:
         "lng": lng,
         "address": text.strip()
     }
-    return json.dumps(address_data)
+    return _dumps(address_data)
 
 
-def get_column_value(item: Dict, column_id: str) -> Optional[Dict]:
-    """Get column value from item by column ID."""
-    for col_val in item.get("column_values", []):
-        if col_val.get("id") == column_id:
-            return col_val
-    return None
+class Geocoder:
+    """
+    Coordinates for address texts from OpenStreetMap Nominatim.
+    
+    Results (including "not found") are cached in a SQLite file, so each text
+    is looked up once across runs; requests are spaced GEOCODER_MIN_INTERVAL apart.
+    """
+    
+    def __init__(self, cache_path: str, country_codes: str = "de"):
+        self.country_codes = country_codes
+        self._db = sqlite3.connect(cache_path)
+        self._db.execute("CREATE TABLE IF NOT EXISTS geocode (text TEXT PRIMARY KEY, lat REAL, lng REAL)")
+        self._memo = {}
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = GEOCODER_USER_AGENT
+        self._last_request = 0.0
+    
+    def geocode(self, text: str) -> Optional[Tuple[float, float]]:
+        """Coordinates for text, or None if it cannot be geocoded."""
+        if text in self._memo:
+            return self._memo[text]
+        
+        row = self._db.execute("SELECT lat, lng FROM geocode WHERE text = ?", (text,)).fetchone()
+        if row:
+            coords = (row[0], row[1]) if row[0] is not None else None
+        else:
+            try:
+                coords = self._lookup(text)
+            except (requests.RequestException, ValueError) as e:
+                # Not cached, so the text is tried again next time
+                print(f"  Warning: geocoding '{text}' failed: {e}")
+                return None
+            self._db.execute(
+                "INSERT OR REPLACE INTO geocode (text, lat, lng) VALUES (?, ?, ?)",
+                (text, *(coords or (None, None)))
+            )
+            self._db.commit()
+        
+        self._memo[text] = coords
+        return coords
+    
+    def _lookup(self, text: str) -> Optional[Tuple[float, float]]:
+        """Query Nominatim for text."""
+        wait = GEOCODER_MIN_INTERVAL - (time.monotonic() - self._last_request)
+        if wait > 0:
+            time.sleep(wait)
+        try:
+            response = self._session.get(
+                NOMINATIM_URL,
+                params={"q": text, "format": "json", "limit": 1, "countrycodes": self.country_codes},
+                timeout=10
+            )
+            response.raise_for_status()
+            results = response.json()
+        finally:
+            self._last_request = time.monotonic()
+        
+        if results:
+            return float(results[0]["lat"]), float(results[0]["lon"])
+        return None
+
+
+def index_columns(item: Dict) -> Dict[str, Dict]:
+    """Column values of an item by column ID."""
+    return {col_val.get("id"): col_val for col_val in item.get("column_values", [])}
 
 
 def is_column_empty(col_value: Optional[Dict]) -> bool:
@@ -144,7 +240,7 @@ def is_column_empty(col_value: Optional[Dict]) -> bool:
     
     if value:
         try:
-            value_data = json.loads(value) if isinstance(value, str) else value
+            value_data = _loads(value) if isinstance(value, str) else value
             if isinstance(value_data, dict):
                 # For address columns, check if address field has content
                 if value_data.get("address"):
@@ -200,7 +296,8 @@ def transfer_text_to_address(
     target_column_id: str,
     country_id: int = DEFAULT_COUNTRY_ID,
     dry_run: bool = False,
-    limit: Optional[int] = None
+    limit: Optional[int] = None,
+    geocoder: Optional[Geocoder] = None
 ) -> Dict:
     """
     Transfer text values to address column.
@@ -212,6 +309,8 @@ def transfer_text_to_address(
         target_column_id: Target address column ID
         dry_run: If True, don't make any changes
         limit: Optional limit on number of items to process
+        geocoder: Optional geocoder for texts without a known city
+                  (otherwise they get the Germany center coordinates)
         
     Returns:
         Statistics dictionary
@@ -219,7 +318,6 @@ def transfer_text_to_address(
     stats = {
         "total_items": 0,
         "transferred": 0,
-        "skipped_no_source": 0,
         "skipped_target_filled": 0,
         "errors": 0
     }
@@ -244,69 +342,72 @@ def transfer_text_to_address(
     if dry_run:
         print("[DRY RUN MODE - No changes will be made]\n")
     
-    cursor = None
     page = 1
     processed = 0
     
-    while True:
-        print(f"Processing page {page}...", flush=True)
-        result = client.get_all_items_paginated(board_id, cursor=cursor, include_updates=False)
-        items = result.get("items", [])
-        
-        if not items:
-            break
+    # Only fetch items with source text (filtered server-side). Whether the target
+    # is empty is still checked here, so is_column_empty's rules stay authoritative.
+    items_query = {"rules": [{"column_id": source_column_id, "compare_value": [], "operator": "is_not_empty"}]}
+    
+    def fetch_page(cursor: Optional[str]) -> Dict:
+        if cursor:
+            time.sleep(0.5)  # Rate limit protection
+        return client.get_all_items_paginated(
+            board_id, cursor=cursor, include_updates=False, query_params=items_query
+        )
+    
+    # Pages are fetched one ahead, so the next page loads while this one is processed
+    with ThreadPoolExecutor(max_workers=1) as page_pool:
+        next_page = page_pool.submit(fetch_page, None)
         
-        for item in items:
-            if limit and processed >= limit:
-                break
-            
-            item_id = item.get("id")
-            item_name = item.get("name", "")
-            stats["total_items"] += 1
-            processed += 1
-            
-            # Get source column value
-            source_col = get_column_value(item, source_column_id)
-            source_text = source_col.get("text", "").strip() if source_col else ""
-            
-            if not source_text:
-                stats["skipped_no_source"] += 1
-                skipped_items.append({
-                    "id": item_id,
-                    "name": item_name,
-                    "reason": "no_source_data"
-                })
-                continue
+        while True:
+            result = next_page.result()
+            items = result.get("items", [])
             
-            # Check target column
-            target_col = get_column_value(item, target_column_id)
-            if not is_column_empty(target_col):
-                stats["skipped_target_filled"] += 1
-                skipped_items.append({
-                    "id": item_id,
-                    "name": item_name,
-                    "reason": "target_not_empty"
-                })
-                continue
+            if not items:
+                break
             
-            # Convert and transfer
-            address_json = text_to_address_json(source_text, country_id)
+            cursor = result.get("cursor")
+            if cursor and not (limit and processed + len(items) >= limit):
+                next_page = page_pool.submit(fetch_page, cursor)
             
-            if dry_run:
-                print(f"  [DRY RUN] Item {item_id} ({item_name}): '{source_text}' -> address column")
-                stats["transferred"] += 1
-                transferred_items.append({
-                    "id": item_id,
-                    "name": item_name,
-                    "source_text": source_text
-                })
-            else:
-                success, message = update_column_value(
-                    client, board_id, item_id, target_column_id, address_json
-                )
+            for item in items:
+                if limit and processed >= limit:
+                    break
+                
+                item_id = item.get("id")
+                item_name = item.get("name", "")
+                processed += 1
+                columns = index_columns(item)
+                
+                # Get source column value
+                source_col = columns.get(source_column_id)
+                source_text = source_col.get("text", "").strip() if source_col else ""
+                
+                if not source_text:
+                    # Whitespace-only text passes the server-side filter
+                    continue
+                stats["total_items"] += 1
                 
-                if success:
-                    print(f"  ✓ Item {item_id} ({item_name}): '{source_text}' -> address column")
+                # Check target column
+                target_col = columns.get(target_column_id)
+                if not is_column_empty(target_col):
+                    stats["skipped_target_filled"] += 1
+                    skipped_items.append({
+                        "id": item_id,
+                        "name": item_name,
+                        "reason": "target_not_empty"
+                    })
+                    continue
+                
+                # Convert and transfer
+                coords = None
+                if geocoder and not extract_city_from_text(source_text):
+                    coords = geocoder.geocode(source_text)
+                address_json = text_to_address_json(source_text, country_id, coords)
+                
+                # Successful items are listed once in the summary below
+                if dry_run:
                     stats["transferred"] += 1
                     transferred_items.append({
                         "id": item_id,
@@ -314,35 +415,43 @@ def transfer_text_to_address(
                         "source_text": source_text
                     })
                 else:
-                    print(f"  ✗ Item {item_id} ({item_name}): ERROR - {message}")
-                    stats["errors"] += 1
-                    error_items.append({
-                        "id": item_id,
-                        "name": item_name,
-                        "source_text": source_text,
-                        "error": message
-                    })
-                
-                # Rate limit protection
-                time.sleep(0.2)
-        
-        if limit and processed >= limit:
-            break
-        
-        cursor = result.get("cursor")
-        if not cursor:
-            break
-        
-        page += 1
-        time.sleep(0.5)
+                    success, message = update_column_value(
+                        client, board_id, item_id, target_column_id, address_json
+                    )
+                    
+                    if success:
+                        stats["transferred"] += 1
+                        transferred_items.append({
+                            "id": item_id,
+                            "name": item_name,
+                            "source_text": source_text
+                        })
+                    else:
+                        print(f"  ✗ Item {item_id} ({item_name}): ERROR - {message}")
+                        stats["errors"] += 1
+                        error_items.append({
+                            "id": item_id,
+                            "name": item_name,
+                            "source_text": source_text,
+                            "error": message
+                        })
+            
+            print(f"Processed page {page}: {processed} items")
+            
+            if limit and processed >= limit:
+                break
+            
+            if not cursor:
+                break
+            
+            page += 1
     
     # Print summary
     print(f"\n{'='*60}")
     print("SUMMARY")
     print(f"{'='*60}")
-    print(f"Total items processed: {stats['total_items']}")
+    print(f"Items with source text: {stats['total_items']}")
     print(f"Transferred: {stats['transferred']}")
-    print(f"Skipped (no source data): {stats['skipped_no_source']}")
     print(f"Skipped (target not empty): {stats['skipped_target_filled']}")
     print(f"Errors: {stats['errors']}")
     print(f"{'='*60}")
@@ -406,6 +515,11 @@ def main():
         "--log",
         help="Save log to JSON file"
     )
+    parser.add_argument(
+        "--geocode-cache",
+        help="Geocode texts without a known city via OpenStreetMap Nominatim, "
+             "caching results in this SQLite file"
+    )
     
     args = parser.parse_args()
     
@@ -425,7 +539,8 @@ def main():
         args.target_column,
         country_id=args.country_id,
         dry_run=args.dry_run,
-        limit=args.limit
+        limit=args.limit,
+        geocoder=Geocoder(args.geocode_cache) if args.geocode_cache else None
     )
     
     # Save log if requested
@@ -12,7 +12,9 @@ import os
 import sys
 import json
 import random
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from typing import Dict, List
 from dotenv import load_dotenv
 from export_boards import MondayAPIClient
@@ -36,11 +38,10 @@ def get_board_item_count(client: MondayAPIClient, board_id: str) -> int:
     # For now, we'll use a different approach
     
     # Fetch first page to get cursor
-    result = client.get_all_items_paginated(board_id, limit=1)
+    result = client.get_all_items_paginated(board_id, limit=1, include_updates=False)
     if not result.get("cursor"):
         # Small board, count directly
-        items = client.get_all_items_paginated(board_id, limit=10000)
-        return len(items.get("items", []))
+        return sum(1 for _ in client.iter_all_items(board_id, include_updates=False))
     
     # Large board - estimate or count via pagination
     # For validation purposes, we'll sample
@@ -49,25 +50,35 @@ def get_board_item_count(client: MondayAPIClient, board_id: str) -> int:
 
 def sample_items(client: MondayAPIClient, board_id: str, sample_size: int = 100) -> List[Dict]:
     """Randomly sample items from board."""
-    # Get all items (or a large sample)
-    all_items = []
-    cursor = None
-    
-    while len(all_items) < sample_size * 10:  # Get more than needed for sampling
-        result = client.get_all_items_paginated(board_id, cursor=cursor, limit=500)
-        items = result.get("items", [])
-        if not items:
-            break
-        all_items.extend(items)
-        cursor = result.get("cursor")
-        if not cursor:
-            break
+    # Reservoir sampling (Algorithm R) over the first sample_size * 10 items,
+    # so only the sample and the current page are held in memory
+    sample = []
+    items = islice(client.iter_all_items(board_id, include_updates=False), sample_size * 10)
+    for i, item in enumerate(items):
+        if i < sample_size:
+            sample.append(item)
+        else:
+            j = random.randrange(i + 1)
+            if j < sample_size:
+                sample[j] = item
     
-    # Randomly sample
-    if len(all_items) <= sample_size:
-        return all_items
+    return sample
+
+
+def build_expected_index(merge_log: Dict) -> Dict[str, Dict]:
+    """
+    Index the merge log by target item ID.
     
-    return random.sample(all_items, sample_size)
+    Created items are expected to carry the source item's name; updated items are
+    recorded with no expectations (the merge keeps the target item's name).
+    """
+    expected_by_id = {}
+    for entry in merge_log.get("entries", []):
+        if entry.get("action") == "create" and entry.get("item_id"):
+            expected_by_id[entry["item_id"]] = {"name": entry.get("item_name")}
+        elif entry.get("action") == "update" and entry.get("target_item_id"):
+            expected_by_id.setdefault(entry["target_item_id"], {})
+    return expected_by_id
 
 
 def validate_item(item: Dict, expected_data: Dict) -> Dict:
@@ -77,17 +88,23 @@ def validate_item(item: Dict, expected_data: Dict) -> Dict:
     item_id = item.get("id")
     item_name = item.get("name", "")
     
+    # Nothing to compare for items the merge did not touch
+    if not expected_data:
+        return {
+            "item_id": item_id,
+            "item_name": item_name,
+            "valid": True,
+            "issues": issues
+        }
+    
     # Check name
     if expected_data.get("name") and item_name != expected_data["name"]:
         issues.append(f"Name mismatch: expected '{expected_data['name']}', got '{item_name}'")
     
     # Check column values
+    col_vals = {cv.get("id"): cv for cv in item.get("column_values", [])}
     for col_id, expected_value in expected_data.get("column_values", {}).items():
-        col_val = None
-        for cv in item.get("column_values", []):
-            if cv.get("id") == col_id:
-                col_val = cv
-                break
+        col_val = col_vals.get(col_id)
         
         if not col_val:
             issues.append(f"Missing column {col_id}")
@@ -126,24 +143,34 @@ def main():
     with open(args.log, 'r', encoding='utf-8') as f:
         merge_log = json.load(f)
     
+    # One lookup per sampled item instead of a scan over all log entries
+    expected_by_id = build_expected_index(merge_log)
+    
     client = MondayAPIClient(api_token)
     
     print("="*60)
     print("Merge Validation")
     print("="*60)
     
-    # Get board counts
-    print("\nFetching board item counts...")
-    source_count = get_board_item_count(client, SOURCE_BOARD_ID)
-    target_count = get_board_item_count(client, TARGET_BOARD_ID)
-    
-    print(f"  Source board items: {source_count or 'N/A (too large)'}")
-    print(f"  Target board items: {target_count or 'N/A (too large)'}")
-    
-    # Sample items for validation
-    print(f"\nSampling {args.sample_size} items from target board...")
-    sampled_items = sample_items(client, TARGET_BOARD_ID, args.sample_size)
-    print(f"  Sampled {len(sampled_items)} items")
+    # The board counts and the sample are independent; fetch them concurrently.
+    # Cursor pagination keeps the pages within each of them sequential.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        source_count_future = pool.submit(get_board_item_count, client, SOURCE_BOARD_ID)
+        target_count_future = pool.submit(get_board_item_count, client, TARGET_BOARD_ID)
+        sample_future = pool.submit(sample_items, client, TARGET_BOARD_ID, args.sample_size)
+        
+        # Get board counts
+        print("\nFetching board item counts...")
+        source_count = source_count_future.result()
+        target_count = target_count_future.result()
+        
+        print(f"  Source board items: {source_count or 'N/A (too large)'}")
+        print(f"  Target board items: {target_count or 'N/A (too large)'}")
+        
+        # Sample items for validation
+        print(f"\nSampling {args.sample_size} items from target board...")
+        sampled_items = sample_future.result()
+        print(f"  Sampled {len(sampled_items)} items")
     
     # Validate sampled items
     print("\nValidating sampled items...")
@@ -163,13 +190,20 @@ def main():
             validation["valid"] = False
             validation["issues"] = ["Missing item name"]
         
+        # Compare items created or updated by the merge with the merge log
+        issues = validate_item(item, expected_by_id.get(validation["item_id"], {}))["issues"]
+        if issues:
+            validation["valid"] = False
+            validation.setdefault("issues", []).extend(issues)
+        
         validation_results.append(validation)
     
     # Generate report
     valid_count = sum(1 for r in validation_results if r["valid"])
     invalid_count = len(validation_results) - valid_count
     
-    report = f"""# Merge Validation Report
+    # Collected as parts and joined once; repeated += would copy the report each time
+    parts = [f"""# Merge Validation Report
 
 Generated: {datetime.now().isoformat()}
 
@@ -190,24 +224,26 @@ Generated: {datetime.now().isoformat()}
 
 ## Validation Results
 
-"""
+"""]
     
     if invalid_count > 0:
-        report += "### Issues Found\n\n"
+        parts.append("### Issues Found\n\n")
         for result in validation_results:
             if not result["valid"]:
-                report += f"- **{result['item_name']}** ({result['item_id']}): {', '.join(result.get('issues', []))}\n"
-        report += "\n"
+                parts.append(f"- **{result['item_name']}** ({result['item_id']}): {', '.join(result.get('issues', []))}\n")
+        parts.append("\n")
     else:
-        report += "✓ All sampled items passed validation.\n\n"
+        parts.append("✓ All sampled items passed validation.\n\n")
     
-    report += "## Sample Items\n\n"
-    report += "| Item ID | Name | Column Count | Status |\n"
-    report += "|---------|------|--------------|--------|\n"
+    parts.append("## Sample Items\n\n")
+    parts.append("| Item ID | Name | Column Count | Status |\n")
+    parts.append("|---------|------|--------------|--------|\n")
     
     for result in validation_results[:20]:  # Show first 20
         status = "✓ Valid" if result["valid"] else "✗ Invalid"
-        report += f"| {result['item_id']} | {result['item_name'][:50]} | {result['column_count']} | {status} |\n"
+        parts.append(f"| {result['item_id']} | {result['item_name'][:50]} | {result['column_count']} | {status} |\n")
+    
+    report = "".join(parts)
     
     # Save report
     os.makedirs(os.path.dirname(args.output), exist_ok=True)
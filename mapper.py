@@ -11,9 +11,19 @@ import sys
 import time
 import json
 import argparse
-from typing import Dict, Optional
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup, falls back to the stdlib json module
+    orjson = None
 
 # Load environment variables
 load_dotenv()
@@ -21,22 +31,215 @@ load_dotenv()
 # Monday.com API endpoint
 MONDAY_API_URL = "https://api.monday.com/v2"
 
+# JSON coding for request bodies, responses and column values (orjson when installed)
+if orjson is not None:
+    _loads = orjson.loads
+    _encode = orjson.dumps
+    
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    _loads = json.loads
+    _dumps = json.dumps
+    
+    def _encode(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 # Mapping: source value -> target value
 GENDER_MAPPING = {
     "weiblich": "Frau",
     "männlich": "Herr"
 }
 
+# Case-insensitive lookup of GENDER_MAPPING
+GENDER_MAPPING_CI = {source.casefold(): target for source, target in GENDER_MAPPING.items()}
+
+# Default number of update requests in flight at once (--concurrency)
+UPDATE_WORKERS = 8
+
+# Number of change_column_value mutations sent as one aliased request
+UPDATE_BATCH_SIZE = 20
+
+# Errors are grouped in the summary by their first this many characters
+ERROR_MESSAGE_LENGTH = 80
+
+# Pause all requests once Monday.com reports fewer remaining requests than this
+RATE_LIMIT_LOW_REMAINING = 5
+
+# Board column metadata is fetched at most once per board within this many seconds
+COLUMNS_CACHE_TTL = 600
+
+# Column metadata is also kept on disk for this many seconds, so repeated runs skip the fetch
+SCHEMA_CACHE_TTL = 3600
+COLUMNS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "board_merge", "columns")
+
+# board_id -> (fetched_at, columns) and (board_id, column_id) -> (fetched_at, option map)
+_COLUMNS_CACHE: Dict[str, Tuple[float, List[Dict]]] = {}
+_OPTION_IDS_CACHE: Dict[Tuple[str, str], Tuple[float, Dict[str, str]]] = {}
+# Boards whose columns in _COLUMNS_CACHE were loaded from the on-disk cache
+_COLUMNS_FROM_DISK = set()
+
+CHANGE_COLUMN_VALUE_MUTATION = """
+mutation ChangeColumnValue($boardId: ID!, $itemId: ID!, $columnId: String!, $value: JSON!) {
+    change_column_value(
+        board_id: $boardId,
+        item_id: $itemId,
+        column_id: $columnId,
+        value: $value
+    ) {
+        id
+    }
+}
+"""
+
+
+def _columns_cache_path(board_id: str) -> str:
+    return os.path.join(COLUMNS_CACHE_DIR, f"{board_id}.json")
+
+
+def _load_cached_columns(board_id: str) -> Optional[List[Dict]]:
+    """Columns from the on-disk cache, or None if missing, unreadable or older than SCHEMA_CACHE_TTL."""
+    try:
+        with open(_columns_cache_path(board_id), 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if time.time() - cached["fetched_at"] < SCHEMA_CACHE_TTL:
+            return cached["columns"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _save_cached_columns(board_id: str, columns: List[Dict]):
+    """Write columns to the on-disk cache; failures only cost a fetch next run."""
+    path = _columns_cache_path(board_id)
+    try:
+        os.makedirs(COLUMNS_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"fetched_at": time.time(), "columns": columns}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: Could not cache board columns: {e}")
+
+
+def _parse_option_ids(settings_str: Optional[str]) -> Dict[str, str]:
+    """Build the label -> option ID mapping from a dropdown column's settings_str."""
+    settings = _loads(settings_str or "{}")
+    labels = settings.get("labels", {})
+    
+    # Build mapping: label -> option ID
+    option_map = {}
+    
+    # Handle different label formats from Monday.com API
+    if isinstance(labels, dict):
+        # Format: {"option_id": {"name": "Label"}}
+        for option_id, label_data in labels.items():
+            if isinstance(label_data, dict):
+                label = label_data.get("name", "")
+            else:
+                label = str(label_data)
+            option_map[label] = option_id
+    elif isinstance(labels, list):
+        # Format: [{"id": "option_id", "name": "Label"}, ...]
+        for label_item in labels:
+            if isinstance(label_item, dict):
+                option_id = label_item.get("id", "")
+                label = label_item.get("name", "")
+                option_map[label] = option_id
+    return option_map
+
+
+class GraphQLError(Exception):
+    """A GraphQL response with errors; the error objects are kept in .errors."""
+    
+    def __init__(self, errors: List[Dict]):
+        super().__init__(f"GraphQL errors: {errors}")
+        self.errors = errors
+
+
+def describe_error(error: Exception) -> str:
+    """Short description of an update error; errors with the same description are counted together."""
+    if isinstance(error, GraphQLError) and error.errors:
+        first = error.errors[0]
+        if isinstance(first, dict):
+            code = (first.get("extensions") or {}).get("code")
+            message = f"{code}: {first.get('message', '')}" if code else first.get("message", "")
+        else:
+            message = str(first)
+    else:
+        message = f"{type(error).__name__}: {error}"
+    return message[:ERROR_MESSAGE_LENGTH]
+
+
+class RateLimiter:
+    """
+    Paces API calls across threads.
+    
+    Calls are spaced at least min_interval seconds apart (0 = no fixed pause).
+    When a response reports that the rate limit is nearly used up, or a request
+    is rejected with 429, all callers pause until the limit resets.
+    """
+    
+    def __init__(self, min_interval: float = 0.0, low_remaining: int = RATE_LIMIT_LOW_REMAINING):
+        self.min_interval = min_interval
+        self.low_remaining = low_remaining
+        self._lock = threading.Lock()
+        self._next_call = 0.0
+    
+    def wait(self):
+        """Block until the next call may be sent."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_call - now
+            self._next_call = max(now, self._next_call) + self.min_interval
+        if delay > 0:
+            time.sleep(delay)
+    
+    def pause(self, seconds: float):
+        """Hold back all calls for the given number of seconds."""
+        with self._lock:
+            self._next_call = max(self._next_call, time.monotonic() + max(seconds, self.min_interval))
+    
+    def update(self, headers) -> None:
+        """Pause if the response headers show the rate limit is nearly used up."""
+        try:
+            remaining = int(headers["X-RateLimit-Remaining"])
+        except (KeyError, TypeError, ValueError):
+            return
+        if remaining < self.low_remaining:
+            try:
+                reset_in = float(headers.get("X-RateLimit-Reset") or headers.get("Retry-After") or 1)
+            except ValueError:
+                reset_in = 1.0
+            self.pause(reset_in)
+
 
 class MondayAPIClient:
     """Client for interacting with Monday.com GraphQL API."""
     
-    def __init__(self, api_token: str):
+    def __init__(self, api_token: str, rate_limiter: Optional[RateLimiter] = None,
+                 max_connections: int = UPDATE_WORKERS):
         self.api_token = api_token
         self.headers = {
             "Authorization": api_token,
             "Content-Type": "application/json"
         }
+        self.rate_limiter = rate_limiter or RateLimiter()
+        # One session for all calls: keep-alive instead of a new TLS connection per request
+        self.session = self._create_session(max_connections)
+    
+    @staticmethod
+    def _create_session(max_connections: int) -> requests.Session:
+        """Session with a keep-alive connection pool that retries failed connections."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            # One connection per concurrent update worker
+            pool_maxsize=max_connections,
+            max_retries=Retry(total=3)
+        )
+        session.mount("https://", adapter)
+        return session
     
     def execute_query(self, query: str, variables: Optional[Dict] = None) -> Dict:
         """Execute a GraphQL query/mutation."""
@@ -44,9 +247,10 @@ class MondayAPIClient:
         if variables:
             payload["variables"] = variables
         
-        response = requests.post(
+        self.rate_limiter.wait()
+        response = self.session.post(
             MONDAY_API_URL,
-            json=payload,
+            data=_encode(payload),
             headers=self.headers
         )
         
@@ -54,19 +258,35 @@ class MondayAPIClient:
         if response.status_code == 429:
             retry_after = int(response.headers.get("Retry-After", 60))
             print(f"Rate limited. Waiting {retry_after} seconds...")
-            time.sleep(retry_after)
+            self.rate_limiter.pause(retry_after)
             return self.execute_query(query, variables)
+        self.rate_limiter.update(response.headers)
         
         response.raise_for_status()
-        data = response.json()
+        data = _loads(response.content)
         
         if "errors" in data:
-            raise Exception(f"GraphQL errors: {data['errors']}")
+            raise GraphQLError(data["errors"])
         
         return data.get("data", {})
     
-    def get_board_columns(self, board_id: str) -> Dict:
-        """Fetch board column metadata."""
+    def get_board_columns(self, board_id: str) -> List[Dict]:
+        """
+        Fetch board column metadata.
+        
+        Cached in memory for COLUMNS_CACHE_TTL seconds and on disk (COLUMNS_CACHE_DIR)
+        for SCHEMA_CACHE_TTL seconds.
+        """
+        cached = _COLUMNS_CACHE.get(board_id)
+        if cached and time.monotonic() - cached[0] < COLUMNS_CACHE_TTL:
+            return cached[1]
+        
+        columns = _load_cached_columns(board_id)
+        if columns is not None:
+            _COLUMNS_CACHE[board_id] = (time.monotonic(), columns)
+            _COLUMNS_FROM_DISK.add(board_id)
+            return columns
+        
         query = """
         query GetBoardColumns($boardId: [ID!]!) {
             boards(ids: $boardId) {
@@ -81,10 +301,33 @@ class MondayAPIClient:
         """
         variables = {"boardId": [board_id]}
         result = self.execute_query(query, variables)
-        return result.get("boards", [{}])[0].get("columns", [])
+        columns = result.get("boards", [{}])[0].get("columns", [])
+        _COLUMNS_CACHE[board_id] = (time.monotonic(), columns)
+        _COLUMNS_FROM_DISK.discard(board_id)
+        _save_cached_columns(board_id, columns)
+        return columns
+    
+    def columns_from_disk(self, board_id: str) -> bool:
+        """Whether the cached columns of a board were loaded from disk rather than fetched in this run."""
+        return board_id in _COLUMNS_FROM_DISK
+    
+    def invalidate_board_cache(self, board_id: str):
+        """Drop cached column metadata for a board, e.g. after adding dropdown options."""
+        _COLUMNS_CACHE.pop(board_id, None)
+        _COLUMNS_FROM_DISK.discard(board_id)
+        try:
+            os.remove(_columns_cache_path(board_id))
+        except OSError:
+            pass
+        for key in [key for key in _OPTION_IDS_CACHE if key[0] == board_id]:
+            del _OPTION_IDS_CACHE[key]
     
     def get_column_option_ids(self, board_id: str, column_id: str) -> Dict[str, str]:
-        """Extract option IDs for a dropdown column."""
+        """Extract option IDs for a dropdown column (cached like get_board_columns)."""
+        cached = _OPTION_IDS_CACHE.get((board_id, column_id))
+        if cached and time.monotonic() - cached[0] < COLUMNS_CACHE_TTL:
+            return cached[1]
+        
         columns = self.get_board_columns(board_id)
         
         for col in columns:
@@ -92,47 +335,70 @@ class MondayAPIClient:
                 if col["type"] != "dropdown":
                     raise ValueError(f"Column {column_id} is not a dropdown column")
                 
-                settings = json.loads(col.get("settings_str", "{}"))
-                labels = settings.get("labels", {})
-                
-                # Build mapping: label -> option ID
-                option_map = {}
-                
-                # Handle different label formats from Monday.com API
-                if isinstance(labels, dict):
-                    # Format: {"option_id": {"name": "Label"}}
-                    for option_id, label_data in labels.items():
-                        if isinstance(label_data, dict):
-                            label = label_data.get("name", "")
-                        else:
-                            label = str(label_data)
-                        option_map[label] = option_id
-                elif isinstance(labels, list):
-                    # Format: [{"id": "option_id", "name": "Label"}, ...]
-                    for label_item in labels:
-                        if isinstance(label_item, dict):
-                            option_id = label_item.get("id", "")
-                            label = label_item.get("name", "")
-                            option_map[label] = option_id
-                
+                option_map = _parse_option_ids(col.get("settings_str"))
+                _OPTION_IDS_CACHE[(board_id, column_id)] = (time.monotonic(), option_map)
                 return option_map
         
         raise ValueError(f"Column {column_id} not found on board {board_id}")
     
-    def get_all_items(self, board_id: str, source_column: str, target_column: str) -> list:
-        """Fetch all items from a board."""
+    def refresh_column_option_ids(self, board_id: str, column_id: str) -> Dict[str, str]:
+        """
+        Refetch the option IDs of one dropdown column, bypassing the caches.
+        
+        Only this column's settings are fetched. If its options changed (e.g. an
+        option was deleted and re-created, or relabelled), the cached column is
+        replaced in memory and on disk.
+        """
+        query = """
+        query GetColumnSettings($boardId: [ID!]!, $columnId: [String!]) {
+            boards(ids: $boardId) {
+                columns(ids: $columnId) {
+                    id
+                    title
+                    type
+                    settings_str
+                }
+            }
+        }
+        """
+        variables = {"boardId": [board_id], "columnId": [column_id]}
+        result = self.execute_query(query, variables)
+        fresh = result.get("boards", [{}])[0].get("columns", [])
+        if not fresh:
+            raise ValueError(f"Column {column_id} not found on board {board_id}")
+        column = fresh[0]
+        if column["type"] != "dropdown":
+            raise ValueError(f"Column {column_id} is not a dropdown column")
+        
+        option_map = _parse_option_ids(column.get("settings_str"))
+        cached = _OPTION_IDS_CACHE.get((board_id, column_id))
+        if cached is None or cached[1] != option_map:
+            columns = self.get_board_columns(board_id)
+            columns = [column if col["id"] == column_id else col for col in columns]
+            _COLUMNS_CACHE[board_id] = (time.monotonic(), columns)
+            _save_cached_columns(board_id, columns)
+        _OPTION_IDS_CACHE[(board_id, column_id)] = (time.monotonic(), option_map)
+        return option_map
+    
+    def get_all_items(self, board_id: str, source_column: str, target_column: str,
+                      only_with_source: bool = False) -> list:
+        """
+        Fetch all items from a board.
+        
+        With only_with_source, items whose source column is empty are filtered out
+        server-side and never transferred.
+        """
         # Try to fetch items using items_page with a reasonable limit
         query = """
-        query GetItems($boardId: [ID!]!, $limit: Int!, $columnIds: [String!]!) {
+        query GetItems($boardId: [ID!]!, $limit: Int!, $columnIds: [String!]!, $queryParams: ItemsQuery) {
             boards(ids: $boardId) {
-                items_page(limit: $limit) {
+                items_page(limit: $limit, query_params: $queryParams) {
                     items {
                         id
                         name
                         column_values(ids: $columnIds) {
                             id
                             text
-                            value
                         }
                     }
                 }
@@ -145,6 +411,10 @@ class MondayAPIClient:
             "limit": 500,
             "columnIds": [source_column, target_column]
         }
+        if only_with_source:
+            variables["queryParams"] = {
+                "rules": [{"column_id": source_column, "compare_value": [], "operator": "is_not_empty"}]
+            }
         
         result = self.execute_query(query, variables)
         boards = result.get("boards", [])
@@ -155,6 +425,70 @@ class MondayAPIClient:
         items = items_page.get("items", [])
         return items
     
+    def batch_change_column_values(self, board_id: str, column_id: str,
+                                   updates: List[Tuple[str, str]]) -> List[bool]:
+        """
+        Set one column on several items in a single request.
+        
+        Args:
+            updates: (item_id, value JSON) pairs
+        
+        Returns:
+            Per update, whether Monday.com returned the item ID
+        """
+        # mutation ChangeColumnValues(...) { u0: change_column_value(...) { id } u1: ... }
+        var_defs = ["$boardId: ID!", "$columnId: String!"]
+        fields = []
+        variables = {"boardId": board_id, "columnId": column_id}
+        for i, (item_id, value) in enumerate(updates):
+            var_defs.append(f"$itemId{i}: ID!, $value{i}: JSON!")
+            fields.append(
+                f"u{i}: change_column_value(board_id: $boardId, item_id: $itemId{i}, "
+                f"column_id: $columnId, value: $value{i}) {{ id }}"
+            )
+            variables[f"itemId{i}"] = item_id
+            variables[f"value{i}"] = value
+        mutation = f"mutation ChangeColumnValues({', '.join(var_defs)}) {{ {' '.join(fields)} }}"
+        
+        result = self.execute_query(mutation, variables)
+        return [bool((result.get(f"u{i}") or {}).get("id")) for i in range(len(updates))]
+    
+
+
+def update_item(client: MondayAPIClient, board_id: str, column_id: str, item_id: str, option_id: str) -> bool:
+    """Set a dropdown column of one item to the given option. Returns True on success."""
+    variables = {
+        "boardId": board_id,
+        "itemId": item_id,
+        "columnId": column_id,
+        "value": _dumps({"ids": [option_id]})
+    }
+    result = client.execute_query(CHANGE_COLUMN_VALUE_MUTATION, variables)
+    return "change_column_value" in result
+
+
+def update_batch(client: MondayAPIClient, board_id: str, column_id: str,
+                 batch: List[Tuple[str, str]]) -> List[Tuple[bool, Optional[str]]]:
+    """
+    Set a dropdown column on a batch of (item_id, option_id) pairs in one request.
+    
+    If the batch request fails, the items are retried one by one so a single bad
+    item does not fail the whole batch.
+    
+    Returns:
+        Per item, (success, describe_error() of the failure or None)
+    """
+    values = [(item_id, _dumps({"ids": [option_id]})) for item_id, option_id in batch]
+    try:
+        return [(success, None) for success in client.batch_change_column_values(board_id, column_id, values)]
+    except Exception:
+        results = []
+        for item_id, option_id in batch:
+            try:
+                results.append((update_item(client, board_id, column_id, item_id, option_id), None))
+            except Exception as e:
+                results.append((False, describe_error(e)))
+        return results
 
 
 def main():
@@ -190,8 +524,27 @@ def main():
         default=None,
         help="Limit processing to first N items (for testing)"
     )
+    parser.add_argument(
+        "--rate-limit-sleep",
+        type=float,
+        default=0.0,
+        help="Minimum seconds between API requests (default: 0, only pause when rate limited)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=UPDATE_WORKERS,
+        help=f"Number of update requests sent in parallel (default: {UPDATE_WORKERS})"
+    )
+    parser.add_argument(
+        "--refresh-schema",
+        action="store_true",
+        help="Ignore cached board column metadata and fetch it again"
+    )
     
     args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
     
     # Load API token
     api_token = os.getenv("MONDAY_API_TOKEN")
@@ -199,19 +552,27 @@ def main():
         print("Error: MONDAY_API_TOKEN not found in .env file")
         sys.exit(1)
     
-    client = MondayAPIClient(api_token)
+    client = MondayAPIClient(api_token, rate_limiter=RateLimiter(args.rate_limit_sleep),
+                             max_connections=args.concurrency)
     
     print(f"Fetching board metadata for board {args.board}...")
     
+    if args.refresh_schema:
+        client.invalidate_board_cache(args.board)
+    
     # Get option IDs for target column
+    required_options = set(GENDER_MAPPING.values())
     try:
         option_map = client.get_column_option_ids(args.board, args.target_column)
+        if client.columns_from_disk(args.board):
+            # Options may have been added, re-created or relabelled since the schema
+            # was cached; check them against this one column's current settings
+            option_map = client.refresh_column_option_ids(args.board, args.target_column)
         print(f"Found {len(option_map)} options in target column:")
         for label, opt_id in option_map.items():
             print(f"  - {label}: {opt_id}")
         
         # Verify we have the required options
-        required_options = set(GENDER_MAPPING.values())
         available_options = set(option_map.keys())
         missing = required_options - available_options
         if missing:
@@ -223,7 +584,8 @@ def main():
     
     # Fetch all items
     print("\nFetching items from board...")
-    items = client.get_all_items(args.board, args.source_column, args.target_column)
+    # Items without a gender are skipped anyway; the check below stays as a safety net
+    items = client.get_all_items(args.board, args.source_column, args.target_column, only_with_source=True)
     if args.limit:
         items = items[:args.limit]
         print(f"Limited to first {len(items)} items (--limit={args.limit})")
@@ -234,6 +596,16 @@ def main():
     updated_count = 0
     skipped_count = 0
     error_count = 0
+    pending = []
+    error_counts = Counter()
+    error_examples = {}
+    
+    # Bound once instead of looked up per item
+    source_column = args.source_column
+    target_column = args.target_column
+    salutation_for = GENDER_MAPPING_CI.get
+    option_id_for = option_map.get
+    no_value = {}
     
     print("\nProcessing items...")
     for item in items:
@@ -241,78 +613,60 @@ def main():
         item_name = item.get("name", "Unnamed")
         
         # Find source and target column values
-        source_value = None
-        target_value = None
-        
-        for col_val in item.get("column_values", []):
-            if col_val["id"] == args.source_column:
-                text = col_val.get("text") or ""
-                source_value = text.strip() if text else ""
-            elif col_val["id"] == args.target_column:
-                text = col_val.get("text") or ""
-                target_value = text.strip() if text else ""
+        col_vals = {col_val["id"]: col_val for col_val in item.get("column_values", [])}
+        source_value = (col_vals.get(source_column, no_value).get("text") or "").strip()
+        target_value = (col_vals.get(target_column, no_value).get("text") or "").strip()
         
-        # Skip if source is empty
-        if not source_value or source_value.lower() not in GENDER_MAPPING:
+        # Determine target value; skip if source is empty or not a known gender
+        target_salutation = salutation_for(source_value.casefold())
+        if not target_salutation:
             skipped_count += 1
             continue
         
-        # Determine target value
-        target_salutation = GENDER_MAPPING[source_value.lower()]
-        
         # Skip if already correct
         if target_value == target_salutation:
             skipped_count += 1
             continue
         
         # Get option ID for target value
-        if target_salutation not in option_map:
+        option_id = option_id_for(target_salutation)
+        if option_id is None:
             print(f"Warning: Option '{target_salutation}' not found for item {item_name}")
             error_count += 1
             continue
         
-        option_id = option_map[target_salutation]
-        
         if args.dry_run:
             print(f"[DRY RUN] Would update item '{item_name}' ({item_id}):")
             print(f"  Source: {source_value} -> Target: {target_salutation} (ID: {option_id})")
             updated_count += 1
         else:
-            # Update the column value using option ID (more reliable than label)
-            mutation = """
-            mutation ChangeColumnValue($boardId: ID!, $itemId: ID!, $columnId: String!, $value: JSON!) {
-                change_column_value(
-                    board_id: $boardId,
-                    item_id: $itemId,
-                    column_id: $columnId,
-                    value: $value
-                ) {
-                    id
-                }
-            }
-            """
-            
-            variables = {
-                "boardId": args.board,
-                "itemId": item_id,
-                "columnId": args.target_column,
-                "value": json.dumps({"ids": [option_id]})
+            pending.append((item_id, item_name, source_value, target_salutation, option_id))
+    
+    # Send the updates in aliased batches, several batches concurrently; each
+    # request waits on the network, not the CPU
+    if pending:
+        batches = [pending[i:i + UPDATE_BATCH_SIZE] for i in range(0, len(pending), UPDATE_BATCH_SIZE)]
+        print(f"\nUpdating {len(pending)} items in {len(batches)} batches ({args.concurrency} at a time)...")
+        
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            futures = {
+                # Update the column value using option ID (more reliable than label)
+                pool.submit(update_batch, client, args.board, args.target_column,
+                            [(item_id, option_id) for item_id, _, _, _, option_id in batch]): batch
+                for batch in batches
             }
-            
-            try:
-                result = client.execute_query(mutation, variables)
-                if "change_column_value" in result:
-                    print(f"Updated item '{item_name}' ({item_id}): {source_value} -> {target_salutation}")
-                    updated_count += 1
-                else:
-                    print(f"Failed to update item '{item_name}' ({item_id})")
-                    error_count += 1
-            except Exception as e:
-                print(f"Error updating item '{item_name}' ({item_id}): {e}")
-                error_count += 1
-            
-            # Rate limit protection
-            time.sleep(0.3)
+            for future in as_completed(futures):
+                batch = futures[future]
+                for (item_id, item_name, source_value, target_salutation, _), (success, error) in zip(batch, future.result()):
+                    if success:
+                        print(f"Updated item '{item_name}' ({item_id}): {source_value} -> {target_salutation}")
+                        updated_count += 1
+                    else:
+                        # Counted per cause and reported once in the summary
+                        error = error or "No item ID returned"
+                        error_counts[error] += 1
+                        error_examples.setdefault(error, item_id)
+                        error_count += 1
     
     # Summary
     print(f"\n{'='*50}")
@@ -320,6 +674,10 @@ def main():
     print(f"  Updated: {updated_count}")
     print(f"  Skipped: {skipped_count}")
     print(f"  Errors: {error_count}")
+    if error_counts:
+        print("Update errors by cause:")
+        for error, count in error_counts.most_common():
+            print(f"  {count:>5}  {error} (e.g. item {error_examples[error]})")
     print(f"{'='*50}")
 
 